@@ -2,9 +2,10 @@ from src.utils.config_loader import ConfigLoader
 import logging
 import pandas as pd
 from src.utils.relevance_decorator import relevance_decorator
-from src.utils.analyses import AnovaAnalysis, TTestAnalysis, MannWhitneyAnalysis
+from src.utils.analyses import AnovaAnalysis, TTestAnalysis, MannWhitneyAnalysis, split_groups
 from src.utils.reporting import generate_report as _generate_report_actual # Renamed to avoid shadowing
 from src.utils.preprocessing import load_data_with_limits
+from src.utils.group_cache import FrameGroups
 from typing import Tuple, cast, Dict, Optional
 from plotly.subplots import make_subplots
 import plotly.graph_objects as go
@@ -31,6 +32,10 @@ def process_columns(df: pd.DataFrame, config: Config, all_limits: Dict[str, Dict
     ]
     plots: dict[str, go.Figure] = {}
     results: list[AnalysisResult] = []
+    box_plot = loader.get_plot_func("BoxPlot")
+    cumulative_frequency_plot = loader.get_plot_func("CumulativeFrequencyPlot")
+    # Group the frame once for the whole run; the plots share the grouping and the sorted values per column
+    groups = FrameGroups(df, group_col)
 
     for value_col in value_cols:
         logging.info(f"Processing column: {value_col}")
@@ -55,6 +60,8 @@ def process_columns(df: pd.DataFrame, config: Config, all_limits: Dict[str, Dict
         # Initialize result with default None values to prevent UnboundLocalError
         result: AnalysisResult = {'p_value': None, 'test': None, 'F_statistic': None, 'statistic': None}
 
+        # The analyses of this column share one split of its values by group
+        split = split_groups(df, group_col, value_col) if analyses_to_run else None
         for analysis_cls in analyses_to_run:
             analyzer = analysis_cls()
             func = analyzer.analyze
@@ -63,7 +70,7 @@ def process_columns(df: pd.DataFrame, config: Config, all_limits: Dict[str, Dict
                     limits, # Pass limits
                     relevance_threshold,
                 )(func)
-            result: AnalysisResult = func(df, group_col, value_col)
+            result: AnalysisResult = func(df, group_col, value_col, split=split)
             result['column'] = value_col # pyright: ignore[reportGeneralTypeIssues]
             results.append(result)
             logging.info(f"{analysis_cls.__name__} for {value_col}: {result}")
@@ -83,12 +90,10 @@ def process_columns(df: pd.DataFrame, config: Config, all_limits: Dict[str, Dict
         fig: go.Figure = make_subplots(rows=1, cols=2, subplot_titles=(box_plot_title, cumulative_frequency_title))
 
         # Add box plot to the first column
-        plotter = loader.get_plot_instance("BoxPlot")
-        plotter.plot(df, group_col, value_col, limits=limits, fig=fig, row=1, col=1, style_settings=style_settings, results=results)
+        box_plot(df, group_col, value_col, limits=limits, fig=fig, row=1, col=1, style_settings=style_settings, results=results, groups=groups)
 
         # Add cumulative frequency plot to the second column
-        plotter = loader.get_plot_instance("CumulativeFrequencyPlot")
-        plotter.plot(df, group_col, value_col, limits=limits, fig=fig, row=1, col=2, style_settings=style_settings, results=results)
+        cumulative_frequency_plot(df, group_col, value_col, limits=limits, fig=fig, row=1, col=2, style_settings=style_settings, results=results, groups=groups)
 
         fig.update_layout(title_text=f"Plots for {value_col}")
         plots[value_col] = fig
@@ -123,10 +128,10 @@ def run_analysis(config: Config, style_settings: Box, loader: ConfigLoader) -> N
 
     # Generate significance plot
     if any(cast(PlotConfig, plot_cfg)["name"] == "SignificancePlot" for plot_cfg in config["plots"]):
-        plotter = loader.get_plot_instance("SignificancePlot")
+        significance_plot = loader.get_plot_func("SignificancePlot")
         # Pass df, group_col, value_col as required by ABC, even if unused by SignificancePlot
         # Pass a dummy limits dict for SignificancePlot as it doesn't use it directly
-        fig: go.Figure = plotter.plot(df=df, group_col=config.input.group_col, value_col=config.input.value_col, limits={}, results=results, style_settings=style_settings)
+        fig: go.Figure = significance_plot(df=df, group_col=config.input.group_col, value_col=config.input.value_col, limits={}, results=results, style_settings=style_settings)
         plots["Significance Plot"] = fig
 
     generate_reports(plots, results, config)
@@ -4,6 +4,7 @@ Defines statistical analysis modules. All classes implement a common `analyze` i
 """
 
 from abc import ABC
+from typing import NamedTuple, Optional
 import pandas as pd
 import numpy as np
 from scipy import stats
@@ -12,16 +13,48 @@ from .types_custom import AnalysisResult
 from .analysis_registry import register_analysis
 
 
+class GroupSplit(NamedTuple):
+    """
+    The values of one column split by group, in order of appearance.
+
+    Attributes:
+        samples (list[np.ndarray]): The values of each group.
+        means (list[float]): The mean of each group, skipping missing values.
+    """
+    samples: list[np.ndarray]
+    means: list[float]
+
+
+def split_groups(df: pd.DataFrame, group_col: str, value_col: str) -> GroupSplit:
+    """
+    Split the values of `value_col` into one array per group, in order of appearance.
+
+    The split takes a single groupby pass. Callers running several analyses on the same
+    column split once and pass the result to each `analyze` call.
+
+    Rows without a group (NaN in `group_col`) are left out; they do not form a group of their own.
+
+    Returns:
+        GroupSplit: The per-group samples and their means.
+    """
+    grouped = df.groupby(group_col, sort=False, observed=True)[value_col]
+    samples = [s.to_numpy() for _, s in grouped]
+    # The means skip missing values, as np.mean on a Series does
+    return GroupSplit(samples, grouped.mean().tolist())
+
+
 class Analysis(ABC):
     """
     Abstract base class for all statistical analysis types.
     """
 
     def analyze(
-        self, df: pd.DataFrame, group_col: str, value_col: str
+        self, df: pd.DataFrame, group_col: str, value_col: str, split: Optional[GroupSplit] = None
     ) -> AnalysisResult:
         """
         Execute analysis on a given dataset.
+
+        `split` is the result of `split_groups(df, group_col, value_col)` if the caller has it already.
         """
         raise NotImplementedError
 
@@ -31,18 +64,16 @@ class AnovaAnalysis(Analysis):
     """Performs one-way ANOVA across 2 or more groups."""
 
     def analyze(
-        self, df: pd.DataFrame, group_col: str, value_col: str
+        self, df: pd.DataFrame, group_col: str, value_col: str, split: Optional[GroupSplit] = None
     ) -> AnalysisResult:
-        groups = df[group_col].unique()
-        samples = [df[df[group_col] == g][value_col] for g in groups]
+        samples, mean_values = split if split is not None else split_groups(df, group_col, value_col)
         result = stats.f_oneway(*samples)
-        mean_values = [float(np.mean(s)) for s in samples]
         return {
             "test": "ANOVA",
             "F_statistic": float(result.statistic),
             "p_value": float(result.pvalue),
             "significant": bool(result.pvalue < 0.05),
-            "mean_values": mean_values,
+            "mean_values": list(mean_values),
         }
 
 
@@ -51,21 +82,19 @@ class TTestAnalysis(Analysis):
     """Performs independent t-test for exactly two groups."""
 
     def analyze(
-        self, df: pd.DataFrame, group_col: str, value_col: str
+        self, df: pd.DataFrame, group_col: str, value_col: str, split: Optional[GroupSplit] = None
     ) -> AnalysisResult:
-        groups = df[group_col].unique()
-        if len(groups) != 2:
+        samples, mean_values = split if split is not None else split_groups(df, group_col, value_col)
+        if len(samples) != 2:
             return {"error": "T-Test requires exactly two groups."}
-        g1 = df[df[group_col] == groups[0]][value_col]
-        g2 = df[df[group_col] == groups[1]][value_col]
+        g1, g2 = samples
         result: TtestResult = stats.ttest_ind(g1, g2, equal_var=False)
-        mean_values = [float(np.mean(g1)), float(np.mean(g2))]
         return {
             "test": "T-Test",
             "t_statistic": float(result.statistic),
             "p_value": float(result.pvalue),
             "significant": bool(result.pvalue < 0.05),
-            "mean_values": mean_values,
+            "mean_values": list(mean_values),
         }
 
 
@@ -74,19 +103,17 @@ class MannWhitneyAnalysis(Analysis):
     """Performs Mann-Whitney U test (non-parametric) for two groups."""
 
     def analyze(
-        self, df: pd.DataFrame, group_col: str, value_col: str
+        self, df: pd.DataFrame, group_col: str, value_col: str, split: Optional[GroupSplit] = None
     ) -> AnalysisResult:
-        groups = df[group_col].unique()
-        if len(groups) != 2:
+        samples, mean_values = split if split is not None else split_groups(df, group_col, value_col)
+        if len(samples) != 2:
             return {"error": "Mann-Whitney U-Test requires exactly two groups."}
-        g1 = df[df[group_col] == groups[0]][value_col]
-        g2 = df[df[group_col] == groups[1]][value_col]
+        g1, g2 = samples
         result = stats.mannwhitneyu(g1, g2, alternative="two-sided")
-        mean_values = [float(np.mean(g1)), float(np.mean(g2))]
         return {
             "test": "Mann-Whitney U-Test",
             "U_statistic": float(result.statistic),
             "p_value": float(result.pvalue),
             "significant": bool(result.pvalue < 0.05),
-            "mean_values": mean_values,
+            "mean_values": list(mean_values),
         }
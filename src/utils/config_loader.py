@@ -3,7 +3,7 @@ import importlib
 import pkgutil
 from box import Box
 from .analysis_registry import ANALYSIS_REGISTRY
-from .plot_registry import PLOT_REGISTRY
+from .plot_registry import PLOT_FUNCS, PLOT_REGISTRY
 from .types_custom import Config
 
 class ConfigLoader:
@@ -115,3 +115,18 @@ class ConfigLoader:
             KeyError: If the plot name is not registered.
         """
         return PLOT_REGISTRY[name]()
+
+    def get_plot_func(self, name):
+        """
+        Retrieves the `plot` method of a shared instance of a registered plot class.
+
+        Args:
+            name (str): The name of the plot class to retrieve.
+
+        Returns:
+            Callable[..., go.Figure]: The bound `plot` method.
+
+        Raises:
+            KeyError: If the plot name is not registered.
+        """
+        return PLOT_FUNCS[name]
@@ -0,0 +1,160 @@
+"""
+group_cache.py
+Group layout and per-group sorted values of a DataFrame. A `FrameGroups` computes them once per
+analysis run and is passed to the plots, which share them.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional
+import numpy as np
+import pandas as pd
+
+# Above this many rows, per-group sorts run on a thread pool (NumPy releases the GIL while sorting)
+PARALLEL_SORT_THRESHOLD = 200_000
+
+
+class GroupedFrame(NamedTuple):
+    """
+    Row layout of a DataFrame grouped by one column.
+
+    Attributes:
+        keys (pd.Index): The group keys, sorted (or in category order for a Categorical column).
+        codes (np.ndarray): The position of each row's group in `keys`, -1 for rows without a group.
+        order (np.ndarray): The row positions ordered by group, without the rows that have no group.
+        starts (np.ndarray): The start of each group's slice in `order`.
+        ends (np.ndarray): The end (exclusive) of each group's slice in `order`.
+    """
+    keys: pd.Index
+    codes: np.ndarray
+    order: np.ndarray
+    starts: np.ndarray
+    ends: np.ndarray
+
+
+def sort_slices(values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Sorts each slice `values[start:end]` in place.
+
+    Large inputs with several slices are sorted concurrently, with the slices dealt out
+    round-robin to one task per CPU.
+
+    Args:
+        values (np.ndarray): The values, with each group's rows contiguous.
+        starts (np.ndarray): The start index of each group.
+        ends (np.ndarray): The end index (exclusive) of each group.
+
+    Returns:
+        np.ndarray: `values`, sorted within each slice.
+    """
+    slices = [values[start:end] for start, end in zip(starts, ends)]
+    workers = min(len(slices), os.cpu_count() or 1)
+    if workers > 1 and len(values) > PARALLEL_SORT_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_sort_each, (slices[i::workers] for i in range(workers))))
+    else:
+        _sort_each(slices)
+    return values
+
+
+def _sort_each(slices: list[np.ndarray]) -> None:
+    for s in slices:
+        s.sort()
+
+
+def grouped_frame(df: pd.DataFrame, group_col: str) -> GroupedFrame:
+    """
+    Computes the row layout of `df` grouped by `group_col`.
+
+    Args:
+        df (pd.DataFrame): The input DataFrame.
+        group_col (str): The name of the column used for grouping data.
+
+    Returns:
+        GroupedFrame: The group keys, row codes and group-ordered row positions.
+    """
+    column = df[group_col]
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes, keys = column.cat.codes.to_numpy(), column.cat.categories
+    else:
+        codes, keys = pd.factorize(column, sort=True)
+    # Small integer codes let NumPy use a radix sort; rows without a group (code -1) sort first and are cut off
+    small_codes = codes.astype(np.min_scalar_type(-len(keys)))
+    order = np.argsort(small_codes, kind="stable")[np.count_nonzero(codes < 0):]
+    sizes = np.bincount(codes[codes >= 0], minlength=len(keys))
+    ends = np.cumsum(sizes)
+    return GroupedFrame(keys, codes, order, ends - sizes, ends)
+
+
+def sorted_group_values(
+    df: pd.DataFrame, group_col: str, value_col: str, groups: Optional[GroupedFrame] = None
+) -> np.ndarray:
+    """
+    Computes the values of `value_col` ordered by group and sorted within each group.
+
+    Args:
+        df (pd.DataFrame): The input DataFrame.
+        group_col (str): The name of the column used for grouping data.
+        value_col (str): The name of the column containing the values.
+        groups (Optional[GroupedFrame]): The layout of `df` grouped by `group_col`, computed if not given.
+
+    Returns:
+        np.ndarray: The sorted values of each group, one contiguous slice per group of `groups`.
+    """
+    if groups is None:
+        groups = grouped_frame(df, group_col)
+    return sort_slices(df[value_col].to_numpy()[groups.order], groups.starts, groups.ends)
+
+
+class FrameGroups:
+    """
+    The grouping of one DataFrame and the sorted group values of its columns, each computed on first use.
+
+    Create one per analysis run, once the DataFrame is final, and pass it to the plots so that
+    they share one grouping and one sort per column. It does not see later
+    changes to the DataFrame; create a new one after modifying it.
+
+    Attributes:
+        df (pd.DataFrame): The grouped DataFrame.
+        group_col (str): The name of the column used for grouping data.
+    """
+    def __init__(self, df: pd.DataFrame, group_col: str):
+        self.df = df
+        self.group_col = group_col
+        self._layout: Optional[GroupedFrame] = None
+        self._sorted_values: dict[str, np.ndarray] = {}
+
+    @classmethod
+    def of(cls, df: pd.DataFrame, group_col: str, groups: Optional["FrameGroups"] = None) -> "FrameGroups":
+        """
+        Returns `groups` if it groups `df` by `group_col`, and a new FrameGroups otherwise.
+        """
+        if groups is not None and groups.df is df and groups.group_col == group_col:
+            return groups
+        return cls(df, group_col)
+
+    @property
+    def layout(self) -> GroupedFrame:
+        """
+        The row layout of the DataFrame grouped by `group_col`.
+        """
+        if self._layout is None:
+            self._layout = grouped_frame(self.df, self.group_col)
+        return self._layout
+
+    def sorted_values(self, value_col: str) -> np.ndarray:
+        """
+        Returns the values of `value_col` ordered by group and sorted within each group.
+
+        The array is shared between callers, so it must not be modified.
+
+        Args:
+            value_col (str): The name of the column containing the values.
+
+        Returns:
+            np.ndarray: The sorted values of each group, one contiguous slice per group of `layout`.
+        """
+        values = self._sorted_values.get(value_col)
+        if values is None:
+            values = self._sorted_values[value_col] = sorted_group_values(self.df, self.group_col, value_col, self.layout)
+        return values
@@ -6,15 +6,21 @@ Plot classes can be registered using the `register_plot` decorator,
 making them discoverable and instantiable by their names.
 """
 
+from typing import Any, Callable
+
 # A dictionary to store registered plot classes, keyed by their names.
 PLOT_REGISTRY = {}
 
+# The bound `plot` method of one shared instance per registered class, keyed by class name.
+# Plot classes are stateless, so callers can dispatch through this table without instantiating.
+PLOT_FUNCS: dict[str, Callable[..., Any]] = {}
+
 def register_plot(cls):
     """
     Decorator to register a plot class in the PLOT_REGISTRY.
 
     The class name is used as the key in the registry. Only classes ending with
-    "Plot" are registered.
+    "Plot" are registered, and the `plot` method of a shared instance is added to PLOT_FUNCS.
 
     Args:
         cls (type): The plot class to register.
@@ -25,4 +31,5 @@ def register_plot(cls):
     name = cls.__name__
     if name.endswith("Plot"):
         PLOT_REGISTRY[name] = cls
+        PLOT_FUNCS[name] = cls().plot
     return cls
\ No newline at end of file
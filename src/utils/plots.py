@@ -2,15 +2,124 @@
 Plot classes for interactive visualizations using Plotly.
 """
 
+from __future__ import annotations
+
 import pandas as pd
 import numpy as np
-import plotly.express as px
+import functools
 import plotly.graph_objects as go
+from plotly import shapeannotation
 from .plot_registry import register_plot
-from plotly.subplots import make_subplots
-from typing import List, Dict, Optional
+from .group_cache import FrameGroups
+from typing import List, Dict, Optional, TYPE_CHECKING
 from abc import ABC, abstractmethod
-from box import Box # Import Box for style_settings
+
+if TYPE_CHECKING:
+    from box import Box # Import Box for style_settings
+
+# Traces with more points than this are drawn with WebGL (Scattergl) instead of SVG
+WEBGL_THRESHOLD = 5_000
+# Cumulative frequency curves are downsampled to at most this many points,
+# about four per pixel column of a wide (2000 px) canvas
+ECDF_MAX_POINTS = 4 * 2_000
+
+def _box_summary(values: np.ndarray) -> dict:
+    """
+    Computes the box statistics Plotly would otherwise derive client-side from every raw value.
+
+    Quartiles use linear interpolation (Plotly's default quartile method) and the fences are the
+    most extreme values within 1.5 IQR of the box. Only the values beyond the fences are kept as
+    sample points.
+
+    Args:
+        values (np.ndarray): The non-empty, NaN-free sample of one group.
+
+    Returns:
+        dict: The statistics and sample points of a single-box `go.Box` trace.
+    """
+    q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    lowerfence = values[values >= q1 - 1.5 * iqr].min()
+    upperfence = values[values <= q3 + 1.5 * iqr].max()
+    outliers = values[(values < lowerfence) | (values > upperfence)]
+    return {
+        "q1": [q1],
+        "median": [median],
+        "q3": [q3],
+        "lowerfence": [lowerfence],
+        "upperfence": [upperfence],
+        "y": [outliers],
+    }
+
+@functools.lru_cache(maxsize=256)
+def _limit_line_template(
+    annotation_text: str,
+    line_color: str,
+    is_horizontal: bool,
+    xref: str,
+    yref: str,
+    annotation_position: Optional[str],
+    annotation_xshift: Optional[int],
+    annotation_yshift: Optional[int],
+    show_annotation: bool,
+) -> tuple[dict, Optional[dict]]:
+    """
+    Builds the shape and annotation dicts of a limit line at position 0, once per line style and axes.
+
+    Callers copy them, setting the line's position (y for horizontal lines, x for vertical ones).
+    """
+    if is_horizontal:
+        shape_type = "hline"
+        shape = {"type": "line", "x0": 0, "x1": 1, "y0": 0, "y1": 0, "xref": f"{xref} domain", "yref": yref}
+    else:
+        shape_type = "vline"
+        shape = {"type": "line", "x0": 0, "x1": 0, "y0": 0, "y1": 1, "xref": xref, "yref": f"{yref} domain"}
+
+    annotation = None
+    if show_annotation:
+        annotation = shapeannotation.axis_spanning_shape_annotation(
+            None,
+            shape_type,
+            shape,
+            {
+                "annotation_text": annotation_text,
+                "annotation_position": annotation_position,
+                "annotation_xshift": annotation_xshift,
+                "annotation_yshift": annotation_yshift,
+            },
+        )
+        annotation.update(xref=shape["xref"], yref=shape["yref"])
+    shape["line"] = {"dash": "dash", "color": line_color}
+    return shape, annotation
+
+def _resolve_limit_style(style_settings: Box, limit_key: str, is_horizontal: bool) -> tuple:
+    """
+    Resolves the style of one limit line into a plain tuple.
+
+    Args:
+        style_settings (Box): A Box object containing styling configurations.
+        limit_key (str): The limit to resolve ("LSL", "USL" or "T").
+        is_horizontal (bool): Whether the line is horizontal.
+
+    Returns:
+        tuple: (annotation_text, line_color, annotation_position, annotation_xshift, annotation_yshift)
+    """
+    style = style_settings.limits[limit_key] # Changed from limits_style
+    if is_horizontal:
+        return (
+            style["annotation_text"],
+            style["line_color"],
+            style["annotation_position_horizontal"],
+            style["annotation_xshift_horizontal"],
+            style.get("annotation_yshift_horizontal", None),
+        )
+    return (
+        style["annotation_text"],
+        style["line_color"],
+        style["annotation_position_vertical"],
+        style.get("annotation_xshift_vertical", None),
+        style["annotation_yshift_vertical"],
+    )
 
 class Plot(ABC):
     """Base class for all plot types."""
@@ -26,49 +135,63 @@ class Plot(ABC):
         row: Optional[int] = None,
         col: Optional[int] = None,
         results: Optional[List[Dict]] = None,
+        groups: Optional[FrameGroups] = None,
     ) -> go.Figure:
         raise NotImplementedError
 
-    def _add_limit_line(
+    def _build_traces(self, groups: FrameGroups, value_col: str, **options) -> List[dict]:
+        """
+        Builds the data traces of the plot as plain trace dicts. Implemented by plots drawn from the grouped data.
+
+        Traces are built as dicts rather than graph objects so they are validated only once, when
+        they are added to a figure. `options` are plot-specific settings of the traces.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _axis_refs(fig: go.Figure, row: Optional[int] = None, col: Optional[int] = None) -> tuple[str, str]:
+        """
+        Returns the x and y axis references (e.g. "x2", "y2") of a subplot, or of the default axes.
+        """
+        if row is None or col is None:
+            return "x", "y"
+        subplot = fig.get_subplot(row, col)
+        return subplot.xaxis.plotly_name.replace("axis", ""), subplot.yaxis.plotly_name.replace("axis", "")
+
+    def _build_limit_line(
         self,
-        fig: go.Figure,
         value: float,
         annotation_text: str,
         line_color: str,
         is_horizontal: bool,
-        row: Optional[int] = None,
-        col: Optional[int] = None,
+        xref: str = "x",
+        yref: str = "y",
         annotation_position: Optional[str] = None,
         annotation_xshift: Optional[int] = None,
         annotation_yshift: Optional[int] = None,
-    ):
-        # Removed the ValueError check. Plotly's add_hline/add_vline handle None for row/col correctly for standalone figures.
-        # For subplot figures, row/col are always provided from main.py.
+        show_annotation: bool = True,
+    ) -> tuple[dict, Optional[dict]]:
+        """
+        Builds the shape and annotation dicts of a dashed limit line spanning its subplot.
+
+        The result matches what `fig.add_hline`/`fig.add_vline` would add, so that all lines of a plot
+        can be attached with a single layout update instead of one relayout per line.
 
+        Returns:
+            tuple[dict, Optional[dict]]: The line shape and its annotation (None if `show_annotation` is False).
+        """
+        shape, annotation = _limit_line_template(
+            annotation_text, line_color, is_horizontal, xref, yref,
+            annotation_position, annotation_xshift, annotation_yshift, show_annotation,
+        )
+        # Only the line's position along its axis differs between lines of the same style
         if is_horizontal:
-            fig.add_hline(
-                y=value,
-                line_dash="dash",
-                line_color=line_color,
-                annotation_text=annotation_text,
-                annotation_position=annotation_position,
-                row=row,
-                col=col,
-                annotation_xshift=annotation_xshift,
-                annotation_yshift=annotation_yshift,
-            )
+            shape = {**shape, "y0": value, "y1": value}
+            annotation = {**annotation, "y": value} if annotation is not None else None
         else:
-            fig.add_vline(
-                x=value,
-                line_dash="dash",
-                line_color=line_color,
-                annotation_text=annotation_text,
-                annotation_position=annotation_position,
-                row=row,
-                col=col,
-                annotation_xshift=annotation_xshift,
-                annotation_yshift=annotation_yshift,
-            )
+            shape = {**shape, "x0": value, "x1": value}
+            annotation = {**annotation, "x": value} if annotation is not None else None
+        return shape, annotation
 
     def _add_all_limit_lines(
         self,
@@ -79,7 +202,7 @@ class Plot(ABC):
         row: Optional[int] = None,
         col: Optional[int] = None,
     ):
-        limit_styles = style_settings.limits # Changed from limits_style
+        xref, yref = self._axis_refs(fig, row, col)
 
         limits_to_add = [
             (limits.get("lower_limit"), "LSL"),
@@ -87,33 +210,34 @@ class Plot(ABC):
             (limits.get("target_value"), "T"),
         ]
 
+        shapes = []
+        annotations = []
         for limit_value, limit_key in limits_to_add:
             if limit_value is not None:
-                style = limit_styles[limit_key]
-                annotation_text = style["annotation_text"]
-                line_color = style["line_color"]
-
-                if is_horizontal:
-                    annotation_position = style["annotation_position_horizontal"]
-                    annotation_xshift = style["annotation_xshift_horizontal"]
-                    annotation_yshift = style.get("annotation_yshift_horizontal", None)
-                else:
-                    annotation_position = style["annotation_position_vertical"]
-                    annotation_xshift = style.get("annotation_xshift_vertical", None)
-                    annotation_yshift = style["annotation_yshift_vertical"]
-
-                self._add_limit_line(
-                    fig,
+                annotation_text, line_color, annotation_position, annotation_xshift, annotation_yshift = (
+                    _resolve_limit_style(style_settings, limit_key, is_horizontal)
+                )
+                shape, annotation = self._build_limit_line(
                     limit_value,
                     annotation_text,
                     line_color,
                     is_horizontal,
-                    row,
-                    col,
+                    xref,
+                    yref,
                     annotation_position,
                     annotation_xshift,
                     annotation_yshift,
+                    show_annotation=bool(annotation_text), # An empty label in the style skips the annotation
                 )
+                shapes.append(shape)
+                if annotation is not None:
+                    annotations.append(annotation)
+
+        if shapes:
+            fig.update_layout(
+                shapes=fig.layout.shapes + tuple(shapes),
+                annotations=fig.layout.annotations + tuple(annotations),
+            )
 
     def _get_axis_updates(self, axis_style: Box) -> dict:
         updates = {}
@@ -133,29 +257,46 @@ class Plot(ABC):
         axis_style: Box,
         row: Optional[int] = None,
         col: Optional[int] = None,
-        xaxis_name: str = "xaxis",
-        yaxis_name: str = "yaxis",
     ):
-        xaxis_updates = self._get_axis_updates(axis_style)
-        yaxis_updates = self._get_axis_updates(axis_style)
-
-        if row is not None and col is not None:
-            fig.update_layout(**{f"{xaxis_name}{row if row > 1 else ''}": xaxis_updates})
-            fig.update_layout(**{f"{yaxis_name}{col if col > 1 else ''}": yaxis_updates})
-        else:
-            fig.update_layout(xaxis=xaxis_updates, yaxis=yaxis_updates)
+        updates = self._get_axis_updates(axis_style)
+        xref, yref = self._axis_refs(fig, row, col)
+        fig.update_layout({f"xaxis{xref[1:]}": updates, f"yaxis{yref[1:]}": updates})
 
 
 @register_plot
 class BoxPlot(Plot):
-    """Interactive box plot of all groups."""
+    """
+    Interactive box plot of all groups.
+
+    Only the outliers are drawn as points unless the style sets `box_plot.points` to "all".
+    """
+    def _build_traces(self, groups: FrameGroups, value_col: str, points: str = "outliers") -> List[dict]:
+        traces = []
+        # The sorted group values are shared with the cumulative frequency plot of the same run
+        layout = groups.layout
+        sorted_values = groups.sorted_values(value_col)
+
+        # Ship five summary statistics and the outliers per group instead of every raw value
+        for g, start, end in zip(layout.keys, layout.starts, layout.ends):
+            values = sorted_values[start:end]
+            values = values[~np.isnan(values)]
+            if len(values) == 0:
+                continue
+            # The groups are labelled on the x axis; the legend lists them once, for the cumulative frequency curves
+            trace = {"type": "box", "x": [str(g)], "name": str(g), "showlegend": False, "boxpoints": points, **_box_summary(values)}
+            if points == "all":
+                trace["y"] = [values]
+            traces.append(trace)
+        return traces
+
     def plot(self, df: pd.DataFrame, group_col: str, value_col: str,
              style_settings: Box,
              limits: Dict[str, Optional[float]],
              fig: Optional[go.Figure] = None,
              row: Optional[int] = None,
              col: Optional[int] = None,
-             results: Optional[List[Dict]] = None) -> go.Figure:
+             results: Optional[List[Dict]] = None,
+             groups: Optional[FrameGroups] = None) -> go.Figure:
         """
         Generates an interactive box plot for the given data.
 
@@ -169,6 +310,7 @@ class BoxPlot(Plot):
             row (Optional[int]): Row index for subplots.
             col (Optional[int]): Column index for subplots.
             results (Optional[List[Dict]]): Optional list of analysis results.
+            groups (Optional[FrameGroups]): The run's grouping of `df` by `group_col`, computed here if not given.
 
         Returns:
             go.Figure: The Plotly Figure object with the box plot.
@@ -176,24 +318,55 @@ class BoxPlot(Plot):
         if fig is None:
             fig = go.Figure()
 
-        for trace in px.box(df, x=group_col, y=value_col, points="all").data:
-            fig.add_trace(trace, row=row, col=col)
+        points = style_settings.get("box_plot", {}).get("points", "outliers")
+        groups = FrameGroups.of(df, group_col, groups)
+        fig.add_traces(self._build_traces(groups, value_col, points=points), rows=row, cols=col)
 
-        self._add_all_limit_lines(fig, limits, True, style_settings=style_settings, row=row, col=col)
-        self._apply_axis_style(fig, style_settings.axis, row=row, col=col, yaxis_name="yaxis")
+        # Batched, the layout changes reach a FigureWidget's front end as a single update
+        with fig.batch_update():
+            self._add_all_limit_lines(fig, limits, True, style_settings=style_settings, row=row, col=col)
+            self._apply_axis_style(fig, style_settings.axis, row=row, col=col)
 
         return fig
 
 @register_plot
 class CumulativeFrequencyPlot(Plot):
-    """Cumulative frequency plot for each group."""
+    """
+    Cumulative frequency plot for each group.
+
+    Passing `group_col` as a Categorical is cheapest: its codes are used as they are, in category order,
+    and unused categories are skipped.
+    """
+    def _build_traces(self, groups: FrameGroups, value_col: str) -> List[dict]:
+        traces = []
+        # Groups are integer codes into sorted keys (rows without a group are dropped, as groupby
+        # would), and the values come ordered by group and sorted within each group, shared with
+        # the other users of the run's grouping.
+        layout = groups.layout
+        sorted_values = groups.sorted_values(value_col)
+
+        for g, start, end in zip(layout.keys, layout.starts, layout.ends):
+            if start == end:
+                continue
+            vals = sorted_values[start:end]
+            # The cumulative fraction of a value is (rank + 1) / n, so it is only computed for the drawn ranks
+            n = len(vals)
+            ranks = np.linspace(0, n - 1, ECDF_MAX_POINTS).astype(int) if n > ECDF_MAX_POINTS else np.arange(n)
+            # The x values keep their precision for the hover; the cumulative fractions only need float32
+            vals = vals[ranks]
+            cum = (ranks + 1).astype(np.float32) / np.float32(n)
+            trace_type = "scattergl" if len(vals) > WEBGL_THRESHOLD else "scatter"
+            traces.append({"type": trace_type, "x": vals, "y": cum, "mode": "lines", "name": str(g)})
+        return traces
+
     def plot(self, df: pd.DataFrame, group_col: str, value_col: str,
              style_settings: Box,
              limits: Dict[str, Optional[float]],
              fig: Optional[go.Figure] = None,
              row: Optional[int] = None,
              col: Optional[int] = None,
-             results: Optional[List[Dict]] = None) -> go.Figure:
+             results: Optional[List[Dict]] = None,
+             groups: Optional[FrameGroups] = None) -> go.Figure:
         """
         Generates a cumulative frequency plot for the given data.
 
@@ -207,6 +380,7 @@ class CumulativeFrequencyPlot(Plot):
             row (Optional[int]): Row index for subplots.
             col (Optional[int]): Column index for subplots.
             results (Optional[List[Dict]]): Optional list of analysis results.
+            groups (Optional[FrameGroups]): The run's grouping of `df` by `group_col`, computed here if not given.
 
         Returns:
             go.Figure: The Plotly Figure object with the cumulative frequency plot.
@@ -214,13 +388,13 @@ class CumulativeFrequencyPlot(Plot):
         if fig is None:
             fig = go.Figure()
 
-        for g in df[group_col].unique():
-            vals = np.sort(df[df[group_col] == g][value_col])
-            cum = np.arange(1, len(vals) + 1) / len(vals)
-            fig.add_trace(go.Scatter(x=vals, y=cum, mode="lines", name=str(g)), row=row, col=col)
+        groups = FrameGroups.of(df, group_col, groups)
+        fig.add_traces(self._build_traces(groups, value_col), rows=row, cols=col)
 
-        self._add_all_limit_lines(fig, limits, False, style_settings=style_settings, row=row, col=col)
-        self._apply_axis_style(fig, style_settings.axis, row=row, col=col, xaxis_name="xaxis")
+        # Batched, the layout changes reach a FigureWidget's front end as a single update
+        with fig.batch_update():
+            self._add_all_limit_lines(fig, limits, False, style_settings=style_settings, row=row, col=col)
+            self._apply_axis_style(fig, style_settings.axis, row=row, col=col)
 
         return fig
 
@@ -236,7 +410,8 @@ class SignificancePlot(Plot):
              fig: Optional[go.Figure] = None,
              row: Optional[int] = None,
              col: Optional[int] = None,
-             results: Optional[List[Dict]] = None) -> go.Figure:
+             results: Optional[List[Dict]] = None,
+             groups: Optional[FrameGroups] = None) -> go.Figure:
         """
         Generates a bar chart of p-values for each column.
 
@@ -250,20 +425,25 @@ class SignificancePlot(Plot):
             row (Optional[int]): Row index for subplots.
             col (Optional[int]): Column index for subplots.
             results (Optional[List[Dict]]): List of analysis results containing p-values.
+            groups (Optional[FrameGroups]): Unused by this plot type.
 
         Returns:
-            go.Figure: The Plotly Figure object with the p-value bar chart.
+            go.Figure: The Plotly Figure object with the p-value bar chart. Without results, `fig` is
+            returned unchanged, or a new empty Figure if no `fig` was given.
         """
-        if results is None:
-            return go.Figure()
+        if not results:
+            return fig if fig is not None else go.Figure()
 
         if fig is None:
             fig = go.Figure()
 
-        columns = [result['column'] for result in results]
-        p_values = [result['p_value'] for result in results]
+        # Columnar arrays go to the encoder as typed buffers; p-values keep float64, as tiny ones underflow in float32
+        columns = np.fromiter((result['column'] for result in results), dtype=object, count=len(results))
+        p_values = np.fromiter((result['p_value'] for result in results), dtype=np.float64, count=len(results))
 
-        fig.add_trace(go.Bar(x=columns, y=p_values, name="P-Value"), row=row, col=col)
-        fig.add_hline(y=0.05, line_dash="dash", line_color="red", annotation_text="Alpha=0.05", annotation_position="top right", row=row, col=col)
-        self._apply_axis_style(fig, style_settings.axis, row=row, col=col, yaxis_name="yaxis", xaxis_name="xaxis")
+        fig.add_trace(go.Bar(x=columns, y=p_values, name="P-Value", marker_line_width=0), row=row, col=col)
+        xref, yref = self._axis_refs(fig, row, col)
+        shape, annotation = self._build_limit_line(0.05, "Alpha=0.05", "red", True, xref, yref, annotation_position="top right")
+        fig.update_layout(shapes=fig.layout.shapes + (shape,), annotations=fig.layout.annotations + (annotation,))
+        self._apply_axis_style(fig, style_settings.axis, row=row, col=col)
         return fig
\ No newline at end of file
@@ -3,8 +3,10 @@ preprocessing.py
 Data preparation utilities, e.g. outlier removal based on sigma threshold.
 """
 
+import numpy as np
 import pandas as pd
 from typing import Tuple, Dict, List
+from .group_cache import FrameGroups, GroupedFrame, sort_slices
 
 def load_data_with_limits(file_path: str) -> Tuple[pd.DataFrame, Dict[str, Dict[str, float]]]:
     """
@@ -17,54 +19,48 @@ def load_data_with_limits(file_path: str) -> Tuple[pd.DataFrame, Dict[str, Dict[
              {"Limit_Name": {"Column_Name": Value}}
     """
     limits: Dict[str, Dict[str, float]] = {}
-    header_lines = 0
-    column_names: List[str] = []
+    limit_lines: List[Tuple[str, List[float]]] = []
 
-    with open(file_path, "r") as f:
-        lines = f.readlines()
-        for i, line in enumerate(lines):
+    # Read the comment lines one at a time and hand the rest of the open file to the CSV parser,
+    # so the file is opened and read only once
+    with open(file_path, "r", encoding="utf-8") as f:
+        while True:
+            data_start = f.tell()
+            line = f.readline()
             if line.startswith("# limit:"):
                 parts = [p.strip() for p in line.strip().split(":")[1].split(",")]
-                limit_name = parts[0]
-                limit_values = [float(v) for v in parts[1:]]
-
-                # Assuming the first non-comment line is the header
-                if not column_names:
-                    # Find the actual header line after comments
-                    for j in range(i + 1, len(lines)):
-                        if not lines[j].strip().startswith("#"):
-                            column_names = [col.strip() for col in lines[j].strip().split(",")]
-                            break
-
-                # Exclude the group_col from column_names for limits if it's not a value column
-                # This assumes limits are only for value columns
-                # For now, let's assume all columns after the first are value columns for limits
-                # A more robust solution would involve reading config.group_col here, but that's not possible
-                # within this function without passing config.
-                value_column_names = column_names[1:] # Assuming first column is group_col
-
-                if len(limit_values) == len(value_column_names):
-                    limits[limit_name] = {col_name: val for col_name, val in zip(value_column_names, limit_values)}
-                else:
-                    # Handle cases where limits might be missing for some columns or are generic
-                    # For now, if count doesn't match, store as a single value if only one is provided
-                    if len(limit_values) == 1:
-                        # This case might mean a generic limit for all value columns
-                        # Or it's an error in the CSV format
-                        # For now, we'll store it as a generic limit if it's not column-specific
-                        limits[limit_name] = {"__generic__": limit_values[0]}
-                    else:
-                        # If the number of limits doesn't match the number of value columns, it's ambiguous.
-                        # We'll skip this limit line or log a warning.
-                        pass # Or raise an error/log a warning
-
-                header_lines += 1
-            elif line.strip().startswith("#"):
-                header_lines += 1
-            else:
+                limit_lines.append((parts[0], [float(v) for v in parts[1:]]))
+            elif not line.strip().startswith("#"):
+                # The first non-comment line is the header
+                column_names = [col.strip() for col in line.strip().split(",")]
                 break
 
-    df = pd.read_csv(file_path, skiprows=lambda x: x < header_lines)
+        f.seek(data_start)
+        df = pd.read_csv(f)
+
+    # Exclude the group_col from column_names for limits if it's not a value column
+    # This assumes limits are only for value columns
+    # For now, let's assume all columns after the first are value columns for limits
+    # A more robust solution would involve reading config.group_col here, but that's not possible
+    # within this function without passing config.
+    value_column_names = column_names[1:] # Assuming first column is group_col
+
+    for limit_name, limit_values in limit_lines:
+        if len(limit_values) == len(value_column_names):
+            limits[limit_name] = {col_name: val for col_name, val in zip(value_column_names, limit_values)}
+        else:
+            # Handle cases where limits might be missing for some columns or are generic
+            # For now, if count doesn't match, store as a single value if only one is provided
+            if len(limit_values) == 1:
+                # This case might mean a generic limit for all value columns
+                # Or it's an error in the CSV format
+                # For now, we'll store it as a generic limit if it's not column-specific
+                limits[limit_name] = {"__generic__": limit_values[0]}
+            else:
+                # If the number of limits doesn't match the number of value columns, it's ambiguous.
+                # We'll skip this limit line or log a warning.
+                pass # Or raise an error/log a warning
+
     return df, limits
 
 
@@ -84,19 +80,51 @@ def filter_outliers(
     :param sigma_cutoff: Multiplier for MAD for rejection
     :return: Filtered DataFrame
     """
-    def _filter_group(group: pd.DataFrame) -> pd.DataFrame:
-        median = group[value_col].median()
-        mad = (group[value_col] - median).abs().median()
-        mad_std = mad * 1.4826 # scale MAD to be comparable to std deviation
-
-        if mad_std == 0:
-            return group
-
-        lower = median - sigma_cutoff * mad_std
-        upper = median + sigma_cutoff * mad_std
-        return group[(group[value_col] >= lower) & (group[value_col] <= upper)]
-
-    # Apply filtering per group
-    filtered_subset = df.groupby(group_col, group_keys=False).apply(_filter_group, include_groups=False)
-    filtered_df = df.loc[filtered_subset.index]
-    return filtered_df.reset_index(drop=True)
+    groups = FrameGroups(df, group_col)
+    sorted_values = np.asarray(groups.sorted_values(value_col), dtype=np.float64)
+    mask = _mad_mask(df[value_col].to_numpy(dtype=np.float64), sorted_values, groups.layout, sigma_cutoff)
+    return df[mask].reset_index(drop=True)
+
+
+def _mad_mask(values: np.ndarray, sorted_values: np.ndarray, groups: GroupedFrame, sigma_cutoff: float) -> np.ndarray:
+    """
+    Flags the rows whose value lies within median ± sigma_cutoff * MAD of its group.
+
+    :param values: Float values, one per row
+    :param sorted_values: The same values ordered by group and sorted within each group
+    :param groups: Row layout of the groups
+    :param sigma_cutoff: Multiplier for MAD for rejection
+    :return: Boolean mask of the rows to keep
+    """
+    codes, starts, ends = groups.codes, groups.starts, groups.ends
+    has_group = codes >= 0
+    # NaN values are skipped by the medians, as in pandas
+    counts = (ends - starts) - np.bincount(codes[has_group & np.isnan(values)], minlength=len(groups.keys))
+
+    # A trailing NaN makes code -1 (rows without a group) look up NaN bounds
+    median = np.append(_slice_medians(sorted_values, starts, counts), np.nan)
+    deviations = sort_slices(np.abs(values - median[codes])[groups.order], starts, ends)
+    mad_std = np.append(_slice_medians(deviations, starts, counts), np.nan) * 1.4826 # scale MAD to be comparable to std deviation
+
+    # Per-row bounds of the row's group; groups with zero spread are kept whole, rows without a group are dropped
+    median, mad_std = median[codes], mad_std[codes]
+    lower = median - sigma_cutoff * mad_std
+    upper = median + sigma_cutoff * mad_std
+    return has_group & ((mad_std == 0) | ((values >= lower) & (values <= upper)))
+
+
+def _slice_medians(sorted_values: np.ndarray, starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    Computes the median of each group of an array ordered by group and sorted within each group.
+
+    :param sorted_values: Float values ordered by group and sorted within each group, NaN last
+    :param starts: Offset of each group's slice
+    :param counts: Number of non-NaN values per group
+    :return: Median per group, NaN for groups without values
+    """
+    medians = np.full(len(starts), np.nan)
+    observed = counts > 0
+    lo = starts[observed] + (counts[observed] - 1) // 2
+    hi = starts[observed] + counts[observed] // 2
+    medians[observed] = (sorted_values[lo] + sorted_values[hi]) / 2
+    return medians
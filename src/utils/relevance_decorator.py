@@ -12,34 +12,42 @@ def relevance_decorator(
 ) -> collections.abc.Callable[[collections.abc.Callable[..., AnalysisResult]], collections.abc.Callable[..., AnalysisResult]]:
     """
     Decorator to extend an analysis function with a relevance check.
+
+    The limits and threshold are evaluated once, when the decorator is created.
     """
+    # Everything that does not depend on the analysis result is settled up front
+    lower_limit = limits.get("lower_limit")
+    upper_limit = limits.get("upper_limit")
+    if lower_limit is None or upper_limit is None:
+        no_relevance_message: Optional[str] = "Missing lower or upper limit – cannot assess relevance."
+    elif upper_limit - lower_limit == 0:
+        no_relevance_message = "Zero range between limits – cannot assess relevance."
+    else:
+        no_relevance_message = None
+        min_relevant_diff = threshold * (upper_limit - lower_limit)
+    threshold_text = f"{threshold*100:.1f}%"
+
     def decorator(analyze_func: collections.abc.Callable[..., AnalysisResult]) -> collections.abc.Callable[..., AnalysisResult]:
         def wrapper(
             df: pd.DataFrame, group_col: str, value_col: str, *args, **kwargs
         ) -> AnalysisResult:
             result = analyze_func(df, group_col, value_col, *args, **kwargs)
-            if "mean_values" in result and isinstance(result["mean_values"], list):
-                lower_limit = limits.get("lower_limit")
-                upper_limit = limits.get("upper_limit")
-
-                if lower_limit is None or upper_limit is None:
+            mean_values = result.get("mean_values")
+            if isinstance(mean_values, list):
+                if no_relevance_message is not None:
                     result["relevance"] = False
-                    result["message"] = "Missing lower or upper limit – cannot assess relevance."
+                    result["message"] = no_relevance_message
                 else:
-                    range_val = upper_limit - lower_limit
-                    if range_val == 0:
-                        result["relevance"] = False
-                        result["message"] = "Zero range between limits – cannot assess relevance."
+                    # max - min beats np.ptp on the handful of group means
+                    max_diff = max(mean_values) - min(mean_values)
+                    relevance = bool(max_diff >= min_relevant_diff)
+                    result["relevance"] = relevance
+                    if not result.get("significant", False):
+                        result["message"] = "No statistically significant difference."
+                    elif relevance:
+                        result["message"] = f"Significant AND relevant (Diff={max_diff:.2f}, threshold={threshold_text})."
                     else:
-                        max_diff = max(result["mean_values"]) - min(result["mean_values"])
-                        relevance = max_diff >= (threshold * range_val)
-                        result["relevance"] = relevance
-                        if not result.get("significant", False):
-                            result["message"] = "No statistically significant difference."
-                        elif relevance:
-                            result["message"] = f"Significant AND relevant (Diff={max_diff:.2f}, threshold={threshold*100:.1f}%)."
-                        else:
-                            result["message"] = f"Significant but NOT relevant (Diff={max_diff:.2f} < {threshold*100:.1f}%)."
+                        result["message"] = f"Significant but NOT relevant (Diff={max_diff:.2f} < {threshold_text})."
             return result
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
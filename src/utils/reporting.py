@@ -1,10 +1,19 @@
+import asyncio
+import base64
 import plotly.graph_objects as go
+import plotly.io as pio
 from pathlib import Path
 from fpdf import FPDF
-import tempfile
+from kaleido import Kaleido
+from kaleido.errors import ChromeNotFoundError
+from PIL import Image
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 import os
+import threading
 from abc import ABC, abstractmethod
-from typing import List, cast
+from typing import Iterable, List, Optional
 from .types_custom import Config, AnalysisResult
 import re
 
@@ -22,45 +31,333 @@ def get_project_version():
             return match.group(1)
         return "unknown"
 
+_CHROME_NOT_FOUND_MSG = """
+Rendering static images requires Google Chrome, which Kaleido could not find.
+
+Either install Chrome yourself following Google's instructions for your operating system,
+or install it from your terminal by running:
+
+    $ plotly_get_chrome
+"""
+
+def _image_opts(fig: go.Figure) -> dict:
+    """
+    Returns the Kaleido image options of a figure, resolved the way `pio.to_image` does.
+
+    The figure's own size wins over its template's, which wins over `pio.defaults`.
+
+    Args:
+        fig (go.Figure): The figure to render.
+
+    Returns:
+        dict: The format, width, height and scale of the image.
+    """
+    layout = fig.layout
+    return {
+        "format": "png",
+        "width": layout.width or layout.template.layout.width or pio.defaults.default_width,
+        "height": layout.height or layout.template.layout.height or pio.defaults.default_height,
+        "scale": pio.defaults.default_scale,
+    }
+
+async def _render_pngs(figs: List[go.Figure]) -> List[bytes]:
+    """
+    Renders figures to in-memory PNG images concurrently on a pool of Kaleido browser tabs.
+
+    The image size, plotly.js, MathJax, headers and topojson are taken from `pio.defaults`,
+    as for `pio.to_image`.
+
+    Args:
+        figs (List[go.Figure]): The figures to render.
+
+    Returns:
+        List[bytes]: The PNG image bytes, in the same order as `figs`.
+    """
+    if not figs:
+        return []
+    defaults = pio.defaults
+    kopts = {name: value for name in ("plotlyjs", "mathjax", "headers") if (value := getattr(defaults, name))}
+    async with Kaleido(n=min(len(figs), os.cpu_count() or 1), **kopts) as k:
+        return list(await asyncio.gather(
+            *(k.calc_fig(fig, opts=_image_opts(fig), topojson=defaults.topojson) for fig in figs)
+        ))
+
+def _render_pngs_sync(figs: List[go.Figure]) -> List[bytes]:
+    """
+    Renders figures to in-memory PNG images, blocking until all are done.
+
+    The render loop runs on a thread of its own, so this also works when the caller
+    already runs an event loop (e.g. in Jupyter).
+
+    Args:
+        figs (List[go.Figure]): The figures to render.
+
+    Returns:
+        List[bytes]: The PNG image bytes, in the same order as `figs`.
+
+    Raises:
+        RuntimeError: If Kaleido cannot find Chrome.
+    """
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(lambda: asyncio.run(_render_pngs(figs))).result()
+    except ChromeNotFoundError:
+        raise RuntimeError(_CHROME_NOT_FOUND_MSG) from None
+
+def _figure_html(fig: go.Figure, include_plotlyjs: str | bool = 'cdn') -> str:
+    """
+    Returns the HTML fragment of a figure.
+
+    Args:
+        fig (go.Figure): The figure to render.
+        include_plotlyjs (str | bool): How plotly.js is included, as for `go.Figure.to_html`.
+
+    Returns:
+        str: The HTML `<div>` of the figure.
+    """
+    # The figures are built by the pipeline from validated graph objects, so the checks are skipped
+    return pio.to_html(fig, full_html=False, include_plotlyjs=include_plotlyjs, validate=False)
+
+def _encode_png(png: bytes, optimize: bool = False) -> bytes:
+    """
+    Re-encodes a PNG image with Pillow for embedding in a report.
+
+    The fast path uses zlib level 3, which is much quicker than the default level for
+    plot images of about the same size. `optimize` spends extra passes searching for the
+    smallest encoding, for final artifacts where size matters more than build time.
+
+    Args:
+        png (bytes): The PNG image bytes.
+        optimize (bool): Whether to run Pillow's size optimization.
+
+    Returns:
+        bytes: The re-encoded PNG image bytes.
+    """
+    buffer = BytesIO()
+    Image.open(BytesIO(png)).save(buffer, format="PNG", compress_level=3, optimize=optimize)
+    return buffer.getvalue()
+
+def _plots_by_significance(plots: dict[str, go.Figure], results: List[AnalysisResult]) -> dict[str, go.Figure]:
+    """
+    Orders plots by the p-value of the corresponding analysis results, lowest first.
+
+    Args:
+        plots (dict[str, go.Figure]): The plots, named "{plot_type}_{column_name}".
+        results (List[AnalysisResult]): The analysis results.
+
+    Returns:
+        dict[str, go.Figure]: The plots in order of significance.
+    """
+    # Create a dictionary to map column names to p-values
+    p_values = {result['column']: result['p_value'] for result in results if 'column' in result and 'p_value' in result}
+
+    # Sort the plots based on the p-value of the corresponding column, looked up once per plot
+    # The plot name is expected to be in the format "{plot_type}_{column_name}"
+    inf = float('inf')
+    sort_keys = {name: p_values.get(name.rpartition('_')[2], inf) for name in plots}
+    return {name: plots[name] for name in sorted(plots, key=sort_keys.__getitem__)}
+
+# Page layout shared by the HTML reports; the head includes the report information and overview table
+_HTML_HEAD = (
+    "<html><head><title>{title}</title></head><body><a name=\"top\"></a>"
+    "<p>Made with exan v{version}</p>"
+    "<h1>{title}</h1>"
+    "<h2>Report Information</h2>"
+    "<ul>{info}</ul>"
+    "{overview}"
+)
+_INFO_TPL = "<li><strong>{key}:</strong> {value}</li>"
+_PLOT_TPL = "<h2 id=\"{plot_id}\">{name}</h2>{body}<p><a href=\"#top\">Back to Top</a></p>"
+_HTML_TAIL = "</body></html>"
+
+_OVERVIEW_HEAD = (
+    "<h2>Analysis Overview</h2>"
+    "<table border='1'>"
+    "<tr><th>Column</th><th>Test</th><th>P-Value</th><th>Significant</th><th>Relevance</th><th>Message</th></tr>"
+)
+_OVERVIEW_ROW_TPL = (
+    "<tr><td>{link}</td><td>{test}</td><td>{p_value:.4f}</td>"
+    "<td>{significant}</td><td>{relevance}</td><td>{message}</td></tr>"
+)
+
+class _Default(dict):
+    """
+    Format mapping that fills in 'N/A' for fields an analysis result does not have.
+    """
+    def __missing__(self, key: str) -> str:
+        return 'N/A'
+
+_OVERVIEW_HEADINGS = ("Column", "Test", "P-Value", "Significant", "Relevance", "Message")
+_PDF_COLUMN_WIDTHS = (40, 40, 30, 30, 30, 100)
+
+def _overview_row(result: AnalysisResult) -> tuple[str, ...]:
+    """
+    Formats the overview table cells of an analysis result, with 'N/A' for missing fields.
+
+    Args:
+        result (AnalysisResult): The analysis result.
+
+    Returns:
+        tuple[str, ...]: The column, test, p-value, significance, relevance and message texts.
+    """
+    get = result.get
+    return (
+        str(get('column', 'N/A')),
+        str(get('test', 'N/A')),
+        f"{get('p_value', 'N/A'):.4f}",
+        str(get('significant', 'N/A')),
+        str(get('relevance', 'N/A')),
+        str(get('message', 'N/A')),
+    )
+
+# Core PDF font; fpdf2 maps "Arial" onto it with a deprecation warning on every set_font() call
+_PDF_FONT = "helvetica"
+
+def _plot_id(name: str) -> str:
+    """
+    Creates a valid HTML anchor ID from a plot name.
+
+    Args:
+        name (str): The plot name.
+
+    Returns:
+        str: The name with spaces replaced by underscores and punctuation removed.
+    """
+    return name.replace(' ', '_').replace('(', '').replace(')', '').replace('=', '').replace('.', '').replace(',', '')
+
+def _overview_table_html(plots: dict[str, go.Figure], results: List[AnalysisResult]) -> str:
+    """
+    Renders the overview table of non-empty analysis results, linking each column to its plot.
+
+    Args:
+        plots (dict[str, go.Figure]): The plots, in report order.
+        results (List[AnalysisResult]): The analysis results.
+
+    Returns:
+        str: An HTML string representing the overview table.
+    """
+    # Link each column to the anchor of the first plot whose name contains it
+    links: dict[str, str] = {}
+    for result in results:
+        column_name = result.get('column', 'N/A')
+        if column_name not in links:
+            plot_name = next((name for name in plots if column_name in name), None)
+            if plot_name is None:
+                links[column_name] = column_name
+            else:
+                links[column_name] = f"<a href=\"#{_plot_id(plot_name)}\">{column_name}</a>"
+
+    rows = "".join(
+        _OVERVIEW_ROW_TPL.format_map(_Default(result, link=links[result.get('column', 'N/A')]))
+        for result in results
+    )
+    return f"{_OVERVIEW_HEAD}{rows}</table>"
+
+class ReportContext:
+    """
+    The state shared by the report generators of one run.
+
+    A context is created for each `generate_report` call, so nothing derived from the plots
+    and results outlives the run that computed it.
+
+    Attributes:
+        plots (dict[str, go.Figure]): The plots in order of significance, sorted once for all generators.
+        results (List[AnalysisResult]): The analysis results.
+        output_dir (Path): The directory where reports will be saved, created with the context.
+
+    The plots must not be modified while the run's reports are generated.
+    """
+    def __init__(self, plots: dict[str, go.Figure], results: List[AnalysisResult], output_dir: Path):
+        # Plots with lower p-values (higher significance) come first
+        self.plots = _plots_by_significance(plots, results) if results else plots
+        self.results = results
+        self.output_dir = output_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+        # The plots keep their figures alive for the whole run, so their ids stay unique
+        self._html: dict[tuple[int, str | bool], str] = {}
+        self._pngs: dict[int, bytes] = {}
+        # Held while rendering, so concurrent reports wait for the other's images instead of rendering them again
+        self._png_lock = threading.Lock()
+
+    @cached_property
+    def overview_html(self) -> str:
+        """
+        The HTML overview table of the run, rendered on first use and shared by the HTML reports.
+
+        Returns:
+            str: An HTML string representing the overview table, empty without results.
+        """
+        if not self.results:
+            return ""
+        return _overview_table_html(self.plots, self.results)
+
+    def figure_html(self, fig: go.Figure, include_plotlyjs: str | bool = 'cdn') -> str:
+        """
+        Returns the HTML fragment of a figure, serializing it only once per run.
+
+        Args:
+            fig (go.Figure): The figure to render.
+            include_plotlyjs (str | bool): How plotly.js is included, as for `go.Figure.to_html`.
+
+        Returns:
+            str: The HTML `<div>` of the figure.
+        """
+        key = (id(fig), include_plotlyjs)
+        html = self._html.get(key)
+        if html is None:
+            html = self._html[key] = _figure_html(fig, include_plotlyjs)
+        return html
+
+    def figure_pngs(self, figs: List[go.Figure]) -> List[bytes]:
+        """
+        Returns the PNG images of the figures, rendering each figure only once per run,
+        and figures with the same content only once.
+
+        Args:
+            figs (List[go.Figure]): The figures to render.
+
+        Returns:
+            List[bytes]: The PNG image bytes, in the same order as `figs`.
+        """
+        with self._png_lock:
+            missing = list({id(fig): fig for fig in figs if id(fig) not in self._pngs}.values())
+            if missing:
+                # Figures with identical content (e.g. the same plot filed under several names) are rendered once,
+                # keyed by their JSON, which is much cheaper to produce than an image
+                contents = [pio.to_json(fig, validate=False) for fig in missing]
+                unique = dict(zip(contents, missing))
+                rendered = dict(zip(unique, _render_pngs_sync(list(unique.values()))))
+                for fig, content in zip(missing, contents):
+                    self._pngs[id(fig)] = rendered[content]
+            return [self._pngs[id(fig)] for fig in figs]
+
 class ReportGenerator(ABC):
     """
     Abstract base class for all report generators.
 
     Attributes:
-        plots (dict[str, go.Figure]): A dictionary of plot figures, where keys are plot names.
+        plots (dict[str, go.Figure]): A dictionary of plot figures, where keys are plot names, in order of significance.
         results (List[Dict]): A list of analysis results, each a dictionary.
         config (Config): The configuration object for the report.
         output_config (dict): Configuration specific to output settings.
         report_config (dict): Configuration specific to report details.
+        context (ReportContext): The state shared with the other generators of the run. A generator created
+            without one gets its own, for the configured output directory.
         output_dir (Path): The directory where reports will be saved.
         prefix (str): The prefix for report filenames.
     """
-    def __init__(self, plots: dict[str, go.Figure], results: List[AnalysisResult], config: Config):
-        self.plots = plots
-        self.results = results
+    def __init__(self, plots: dict[str, go.Figure], results: List[AnalysisResult], config: Config, context: Optional[ReportContext] = None):
         self.config = config
         self.output_config = self.config["output"]
         self.report_config = self.config["report"]
-        self.output_dir = Path(self.output_config["output_directory"])
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if context is None:
+            context = ReportContext(plots, results, Path(self.output_config["output_directory"]))
+        self.context = context
+        self.plots = context.plots
+        self.results = context.results
+        self.output_dir = context.output_dir
         self.prefix = self.report_config["name"]
         self.project_version = get_project_version()
-        self._sort_plots_by_significance()
-
-    def _sort_plots_by_significance(self):
-        """
-        Sorts the plots dictionary based on the p-value of the corresponding analysis results.
-        Plots with lower p-values (higher significance) come first.
-        """
-        if not self.results:
-            return
-
-        # Create a dictionary to map column names to p-values
-        p_values = {result['column']: result['p_value'] for result in self.results if 'column' in result and 'p_value' in result}
-
-        # Sort the plots based on the p-value of the corresponding column
-        # The plot name is expected to be in the format "{plot_type}_{column_name}"
-        self.plots = dict(sorted(self.plots.items(), key=lambda item: p_values.get(cast(str, item[0].split('_')[-1]), float('inf')))) # pyright: ignore[reportCallIssue, reportArgumentType]
 
     def _generate_overview_table_html(self) -> str:
         """
@@ -69,40 +366,7 @@ class ReportGenerator(ABC):
         Returns:
             str: An HTML string representing the overview table.
         """
-        if not self.results:
-            return ""
-
-        html_lines = []
-        html_lines.append("<h2>Analysis Overview</h2>")
-        html_lines.append("<table border='1'>")
-        html_lines.append("<tr><th>Column</th><th>Test</th><th>P-Value</th><th>Significant</th><th>Relevance</th><th>Message</th></tr>")
-
-        for result in self.results:
-            column_name = result.get('column', 'N/A')
-            plot_link_html = column_name # Default to just the column name
-
-            # Find the plot name that contains the column_name
-            # This assumes that the plot name contains the column_name
-            # and that the plot_id generation logic is consistent
-            for plot_name in self.plots.keys():
-                if column_name in plot_name:
-                    # Generate the plot_id as done in generate() method
-                    plot_id = plot_name.replace(' ', '_').replace('(', '').replace(')', '').replace('=', '').replace('.', '').replace(',', '')
-                    plot_link_html = f"<a href=\"#{plot_id}\">{column_name}</a>"
-                    break # Found a link, break from inner loop
-
-            html_lines.append(
-                f"<tr>"
-                f"<td>{plot_link_html}</td>"
-                f"<td>{result.get('test', 'N/A')}</td>"
-                f"<td>{result.get('p_value', 'N/A'):.4f}</td>"
-                f"<td>{result.get('significant', 'N/A')}</td>"
-                f"<td>{result.get('relevance', 'N/A')}</td>"
-                f"<td>{result.get('message', 'N/A')}</td>"
-                f"</tr>"
-            )
-        html_lines.append("</table>")
-        return "".join(html_lines)
+        return self.context.overview_html
 
     def _generate_overview_table_pdf(self, pdf: FPDF):
         """
@@ -115,24 +379,40 @@ class ReportGenerator(ABC):
             return
 
         pdf.add_page()
-        pdf.set_font("Arial", "B", 16)
+        pdf.set_font(_PDF_FONT, "B", 16)
         pdf.cell(0, 10, "Analysis Overview", 0, 1, "C")
-        pdf.set_font("Arial", "B", 10)
-        pdf.cell(40, 10, "Column", 1, 0, "C")
-        pdf.cell(40, 10, "Test", 1, 0, "C")
-        pdf.cell(30, 10, "P-Value", 1, 0, "C")
-        pdf.cell(30, 10, "Significant", 1, 0, "C")
-        pdf.cell(30, 10, "Relevance", 1, 0, "C")
-        pdf.cell(100, 10, "Message", 1, 1, "C")
-
-        pdf.set_font("Arial", "", 10)
-        for result in self.results:
-            pdf.cell(40, 10, str(result.get('column', 'N/A')), 1, 0)
-            pdf.cell(40, 10, str(result.get('test', 'N/A')), 1, 0)
-            pdf.cell(30, 10, f"{result.get('p_value', 'N/A'):.4f}", 1, 0)
-            pdf.cell(30, 10, str(result.get('significant', 'N/A')), 1, 0)
-            pdf.cell(30, 10, str(result.get('relevance', 'N/A')), 1, 0)
-            pdf.cell(100, 10, str(result.get('message', 'N/A')), 1, 1)
+        pdf.set_font(_PDF_FONT, "B", 10)
+        for width, heading in zip(_PDF_COLUMN_WIDTHS, _OVERVIEW_HEADINGS):
+            pdf.cell(width, 10, heading, 1, 0, "C")
+        pdf.ln()
+
+        pdf.set_font(_PDF_FONT, "", 10)
+        for row in map(_overview_row, self.results):
+            for width, text in zip(_PDF_COLUMN_WIDTHS, row):
+                pdf.cell(width, 10, text, 1, 0)
+            pdf.ln()
+
+    def _write_html_report(self, filename: Path, title: str, bodies: Iterable[str]):
+        """
+        Renders the HTML report from the page templates and writes it in a single call.
+
+        Args:
+            filename (Path): The path of the HTML file.
+            title (str): The report title.
+            bodies (Iterable[str]): The HTML of each plot, in the order of `self.plots`.
+        """
+        head = _HTML_HEAD.format(
+            title=title,
+            version=self.project_version,
+            info="".join(_INFO_TPL.format(key=key, value=value) for key, value in self.report_config.items()),
+            overview=self._generate_overview_table_html(),
+        )
+        plots = "".join(
+            _PLOT_TPL.format(plot_id=_plot_id(name), name=name, body=body)
+            for name, body in zip(self.plots, bodies)
+        )
+        with open(filename, 'w') as f:
+            f.write(f"{head}{plots}{_HTML_TAIL}")
 
     @abstractmethod
     def generate(self):
@@ -151,22 +431,7 @@ class InteractiveHTMLReportGenerator(ReportGenerator):
         Generates the interactive HTML report and saves it to the output directory.
         """
         filename = self.output_dir / f"{self.prefix}.html"
-        with open(filename, 'w') as f:
-            f.write("<html><head><title>Analysis Report</title></head><body><a name=\"top\"></a>")
-            f.write(f"<p>Made with exan v{self.project_version}</p>")
-            f.write("<h1>Analysis Report</h1>")
-            f.write("<h2>Report Information</h2>")
-            f.write("<ul>")
-            for key, value in self.report_config.items():
-                f.write(f"<li><strong>{key}:</strong> {value}</li>")
-            f.write("</ul>")
-            f.write(self._generate_overview_table_html())
-            for name, fig in self.plots.items():
-                plot_id = name.replace(' ', '_').replace('(', '').replace(')', '').replace('=', '').replace('.', '').replace(',', '') # Create a valid ID
-                f.write(f"<h2 id=\"{plot_id}\">{name}</h2>")
-                f.write(fig.to_html(full_html=False, include_plotlyjs='cdn'))
-                f.write("<p><a href=\"#top\">Back to Top</a></p>")
-            f.write("</body></html>")
+        self._write_html_report(filename, "Analysis Report", (self.context.figure_html(fig, include_plotlyjs='cdn') for fig in self.plots.values()))
 
 
 class StaticHTMLReportGenerator(ReportGenerator):
@@ -178,22 +443,13 @@ class StaticHTMLReportGenerator(ReportGenerator):
         Generates the static HTML report and saves it to the output directory.
         """
         filename = self.output_dir / f"{self.prefix}_static.html"
-        with open(filename, 'w') as f:
-            f.write("<html><head><title>Static Analysis Report</title></head><body><a name=\"top\"></a>")
-            f.write(f"<p>Made with exan v{self.project_version}</p>")
-            f.write("<h1>Static Analysis Report</h1>")
-            f.write("<h2>Report Information</h2>")
-            f.write("<ul>")
-            for key, value in self.report_config.items():
-                f.write(f"<li><strong>{key}:</strong> {value}</li>")
-            f.write("</ul>")
-            f.write(self._generate_overview_table_html())
-            for name, fig in self.plots.items():
-                plot_id = name.replace(' ', '_').replace('(', '').replace(')', '').replace('=', '').replace('.', '').replace(',', '') # Create a valid ID
-                f.write(f"<h2 id=\"{plot_id}\">{name}</h2>")
-                f.write(fig.to_html(full_html=False, include_plotlyjs=False))
-                f.write("<p><a href=\"#top\">Back to Top</a></p>")
-            f.write("</body></html>")
+        pngs = self.context.figure_pngs(list(self.plots.values()))
+        optimize = self.output_config.get("optimize_png", False)
+        self._write_html_report(
+            filename,
+            "Static Analysis Report",
+            (f"<img src=\"data:image/png;base64,{base64.b64encode(_encode_png(png, optimize)).decode()}\"/>" for png in pngs),
+        )
 
 
 class PDFReportGenerator(ReportGenerator):
@@ -205,38 +461,44 @@ class PDFReportGenerator(ReportGenerator):
         Generates the PDF report and saves it to the output directory.
         """
         pdf = FPDF()
+        pdf.set_compression(True)
         pdf.set_auto_page_break(auto=True, margin=15)
 
         # Title Page
         pdf.add_page()
-        pdf.set_font("Arial", "", 12)
+        pdf.set_font(_PDF_FONT, "", 12)
         pdf.cell(0, 10, f"Made with exan v{self.project_version}", 0, 1, "C")
-        pdf.set_font("Arial", "B", 24)
+        pdf.set_font(_PDF_FONT, "B", 24)
         pdf.cell(0, 20, "Analysis Report", 0, 1, "C")
-        pdf.set_font("Arial", "B", 16)
+        pdf.set_font(_PDF_FONT, "B", 16)
         pdf.cell(0, 15, "Report Information", 0, 1, "L")
-        pdf.set_font("Arial", "", 12)
+        pdf.set_font(_PDF_FONT, "", 12)
         for key, value in self.report_config.items():
             pdf.cell(0, 10, f"  {key}: {value}", 0, 1, "L")
 
         self._generate_overview_table_pdf(pdf)
 
-        for name, fig in self.plots.items():
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as temp_image:
-                fig.write_image(temp_image.name)
+        pngs = self.context.figure_pngs(list(self.plots.values()))
 
-                pdf.add_page()
-                pdf.set_font("Arial", "B", 16)
-                pdf.cell(0, 10, name, 0, 1, "C")
-                pdf.image(temp_image.name, x=10, y=30, w=190)
-
-            os.remove(temp_image.name)
+        for name, png in zip(self.plots, pngs):
+            pdf.add_page()
+            pdf.set_font(_PDF_FONT, "B", 16)
+            pdf.cell(0, 10, name, 0, 1, "C")
+            pdf.image(BytesIO(png), x=10, y=30, w=190)
 
         pdf_filename = self.output_dir / f"{self.prefix}.pdf"
         pdf.output(str(pdf_filename))
 
 
-def report_generator_factory(format: str, plots: dict[str, go.Figure], results: List[AnalysisResult], config: Config) -> ReportGenerator:
+# Generator class of each report format
+_GENERATORS: dict[str, type[ReportGenerator]] = {
+    "interactive_html": InteractiveHTMLReportGenerator,
+    "static_html": StaticHTMLReportGenerator,
+    "pdf": PDFReportGenerator,
+}
+
+
+def report_generator_factory(format: str, plots: dict[str, go.Figure], results: List[AnalysisResult], config: Config, context: Optional[ReportContext] = None) -> ReportGenerator:
     """
     Factory function to create a ReportGenerator instance based on the specified format.
 
@@ -245,6 +507,7 @@ def report_generator_factory(format: str, plots: dict[str, go.Figure], results:
         plots (dict[str, go.Figure]): A dictionary of plot figures.
         results (List[AnalysisResult]): A list of analysis results.
         config (Config): The configuration object.
+        context (Optional[ReportContext]): The state shared with the other generators of the run.
 
     Returns:
         ReportGenerator: An instance of a concrete ReportGenerator subclass.
@@ -252,14 +515,10 @@ def report_generator_factory(format: str, plots: dict[str, go.Figure], results:
     Raises:
         ValueError: If an unknown report format is provided.
     """
-    if format == "interactive_html":
-        return InteractiveHTMLReportGenerator(plots, results, config)
-    elif format == "static_html":
-        return StaticHTMLReportGenerator(plots, results, config)
-    elif format == "pdf":
-        return PDFReportGenerator(plots, results, config)
-    else:
+    generator_cls = _GENERATORS.get(format)
+    if generator_cls is None:
         raise ValueError(f"Unknown report format: {format}")
+    return generator_cls(plots, results, config, context)
 
 def generate_report(plots: dict[str, go.Figure], results: list[AnalysisResult], config: Config):
     """
@@ -280,6 +539,14 @@ def generate_report(plots: dict[str, go.Figure], results: list[AnalysisResult],
     if output_config["save_pdf"]:
         report_formats.append("pdf")
 
-    for format in report_formats:
-        generator = report_generator_factory(format, plots, results, config)
-        generator.generate()
+    # The plots are sorted and the output directory created once for all formats
+    context = ReportContext(plots, results, Path(output_config["output_directory"]))
+    generators = [report_generator_factory(format, plots, results, config, context) for format in report_formats]
+    if len(generators) <= 1:
+        for generator in generators:
+            generator.generate()
+        return
+
+    # The formats share no mutable state and mostly wait on file I/O or Kaleido, so they run side by side
+    with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+        list(executor.map(lambda generator: generator.generate(), generators))
@@ -45,6 +45,7 @@ class OutputConfig(TypedDict):
     save_interactive_html: bool
     save_static_html: bool
     save_pdf: bool
+    optimize_png: bool
     output_directory: str
 
 class AxisStyle(TypedDict, total=False):
@@ -70,9 +71,13 @@ class LimitsStyles(TypedDict):
     USL: LimitsStyle
     T: LimitsStyle
 
+class BoxPlotStyle(TypedDict, total=False):
+    points: str # "outliers" (default) or "all"
+
 class StyleConfig(TypedDict, total=False):
     limits: LimitsStyles # Renamed from limits_style
     axis: AxisStyle
+    box_plot: BoxPlotStyle
 
 class InputConfig(TypedDict):
     data_file: str
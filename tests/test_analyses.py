@@ -1,7 +1,8 @@
 import pytest
+from unittest.mock import patch
 import pandas as pd
 import numpy as np
-from src.utils.analyses import AnovaAnalysis, TTestAnalysis, MannWhitneyAnalysis
+from src.utils.analyses import AnovaAnalysis, TTestAnalysis, MannWhitneyAnalysis, split_groups
 
 @pytest.fixture
 def sample_data():
@@ -50,3 +51,40 @@ def test_mannwhitney_analysis_error_with_multiple_groups(sample_data):
     analyzer = MannWhitneyAnalysis()
     result = analyzer.analyze(sample_data, 'group', 'value')
     assert 'error' in result
+
+def test_split_groups(sample_data):
+    two_group_data = sample_data[sample_data['group'].isin(['A', 'B'])]
+    samples, mean_values = split_groups(two_group_data, 'group', 'value')
+    assert [s.tolist() for s in samples] == [[1, 2], [3, 4]]
+    assert mean_values == [1.5, 3.5]
+
+def test_analyses_use_the_given_split(sample_data):
+    two_group_data = sample_data[sample_data['group'].isin(['A', 'B'])]
+    split = split_groups(two_group_data, 'group', 'value')
+    with patch('src.utils.analyses.split_groups') as mock_split:
+        ttest = TTestAnalysis().analyze(two_group_data, 'group', 'value', split=split)
+        mannwhitney = MannWhitneyAnalysis().analyze(two_group_data, 'group', 'value', split=split)
+    mock_split.assert_not_called()
+    assert ttest['mean_values'] == mannwhitney['mean_values'] == [1.5, 3.5]
+
+def test_mean_values_skip_missing_values():
+    df = pd.DataFrame({'group': ['A', 'A', 'A', 'B', 'B'], 'value': [1.0, 2.0, np.nan, 3.0, 5.0]})
+    assert split_groups(df, 'group', 'value').means == [1.5, 4.0]
+
+@pytest.mark.parametrize("analysis_cls", [AnovaAnalysis, TTestAnalysis, MannWhitneyAnalysis])
+def test_results_hold_plain_python_values(sample_data, analysis_cls):
+    two_group_data = sample_data[sample_data['group'].isin(['A', 'B'])]
+    result = analysis_cls().analyze(two_group_data, 'group', 'value')
+    statistic = next(value for key, value in result.items() if key.endswith('_statistic'))
+    assert type(statistic) is float
+    assert type(result['p_value']) is float
+    assert type(result['significant']) is bool
+    assert all(type(mean) is float for mean in result['mean_values'])
+
+def test_split_groups_leaves_out_rows_without_group():
+    df = pd.DataFrame({'group': [np.nan, 'A', 'B', 'A', 'B', np.nan], 'value': [100.0, 1.0, 3.0, 2.0, 4.0, 200.0]})
+    split = split_groups(df, 'group', 'value')
+    assert [list(sample) for sample in split.samples] == [[1.0, 2.0], [3.0, 4.0]]
+    result = TTestAnalysis().analyze(df, 'group', 'value')
+    assert result['mean_values'] == [1.5, 3.5]
+    assert not np.isnan(result['p_value'])
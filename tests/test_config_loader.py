@@ -58,3 +58,21 @@ input:
 
     with pytest.raises(KeyError, match="Missing key in input section: lower_limit_col"):
         ConfigLoader(str(config_file), default_config_file=str(default_config_file))
+
+def test_config_loader_plot_funcs_are_shared_bound_methods(tmp_path):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("""
+input:
+  data_file: "data.csv"
+  group_col: "group"
+  value_col: "value"
+analyses: []
+plots: []
+output: "output"
+report:
+  name: "test_report"
+    """)
+    loader = ConfigLoader(str(config_file))
+    box_plot = loader.get_plot_func("BoxPlot")
+    assert box_plot is loader.get_plot_func("BoxPlot")
+    assert type(box_plot.__self__) is type(loader.get_plot_instance("BoxPlot"))
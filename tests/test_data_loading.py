@@ -2,6 +2,7 @@ import pytest
 import pandas as pd
 from src.utils.preprocessing import load_data_with_limits
 import os
+from unittest.mock import patch
 
 @pytest.fixture
 def create_dummy_csv(tmp_path):
@@ -37,3 +38,17 @@ def test_load_data_with_limits(create_dummy_csv):
     assert limits["Target"]["Data2"] == 1.0
     assert limits["Upper_Limit"]["Value"] == 3.0
     assert limits["Upper_Limit"]["Data2"] == 2.0
+
+def test_load_data_with_limits_reads_utf8(tmp_path):
+    csv_path = tmp_path / "utf8.csv"
+    csv_path.write_text("# limit: Lower_Limit, 1.0\nGruppe,Länge µm\nA,2.5\n", encoding="utf-8")
+
+    # Emulate a platform whose default encoding is cp1252 (e.g. Windows)
+    def cp1252_open(*args, **kwargs):
+        return open(*args, **{"encoding": "cp1252", **kwargs})
+
+    with patch("src.utils.preprocessing.open", side_effect=cp1252_open, create=True):
+        df, limits = load_data_with_limits(csv_path)
+
+    assert list(df.columns) == ["Gruppe", "Länge µm"]
+    assert limits["Lower_Limit"] == {"Länge µm": 1.0}
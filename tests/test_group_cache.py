@@ -0,0 +1,54 @@
+import pytest
+from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import numpy as np
+from src.utils.group_cache import FrameGroups, grouped_frame, sort_slices, sorted_group_values, PARALLEL_SORT_THRESHOLD
+
+@pytest.fixture
+def grouped_df():
+    return pd.DataFrame({'group': ['B', 'A', None, 'B', 'A'], 'value': [4.0, 3.0, 9.0, 1.0, 2.0]})
+
+def test_grouped_frame_layout(grouped_df):
+    groups = grouped_frame(grouped_df, 'group')
+    assert groups.keys.tolist() == ['A', 'B']
+    assert groups.codes.tolist() == [1, 0, -1, 1, 0]
+    assert groups.order.tolist() == [1, 4, 0, 3]
+    assert groups.starts.tolist() == [0, 2]
+    assert groups.ends.tolist() == [2, 4]
+
+def test_sorted_group_values(grouped_df):
+    values = sorted_group_values(grouped_df, 'group', 'value')
+    assert values.tolist() == [2.0, 3.0, 1.0, 4.0]
+
+def test_frame_groups_computes_once(grouped_df):
+    groups = FrameGroups(grouped_df, 'group')
+    layout, values = groups.layout, groups.sorted_values('value')
+    assert values.tolist() == [2.0, 3.0, 1.0, 4.0]
+    with patch('src.utils.group_cache.grouped_frame') as mock_grouped, \
+         patch('src.utils.group_cache.sorted_group_values') as mock_sorted:
+        assert groups.layout is layout
+        assert groups.sorted_values('value') is values
+    mock_grouped.assert_not_called()
+    mock_sorted.assert_not_called()
+
+def test_frame_groups_of_reuses_matching_grouping(grouped_df):
+    groups = FrameGroups(grouped_df, 'group')
+    assert FrameGroups.of(grouped_df, 'group', groups) is groups
+    assert FrameGroups.of(grouped_df.copy(), 'group', groups) is not groups
+    assert FrameGroups.of(grouped_df, 'value', groups).group_col == 'value'
+    assert FrameGroups.of(grouped_df, 'group').df is grouped_df
+
+def test_new_frame_groups_see_in_place_changes(grouped_df):
+    FrameGroups(grouped_df, 'group').sorted_values('value')
+    grouped_df['value'] = grouped_df['value'] * 100
+    assert FrameGroups(grouped_df, 'group').sorted_values('value').tolist() == [200.0, 300.0, 100.0, 400.0]
+
+def test_sort_slices_in_parallel_matches_serial():
+    values = np.random.default_rng(0).normal(size=PARALLEL_SORT_THRESHOLD + 10)
+    expected = np.concatenate([np.sort(values[:10]), np.sort(values[10:])])
+    with patch('src.utils.group_cache.os.cpu_count', return_value=4), \
+         patch('src.utils.group_cache.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_executor:
+        sorted_values = sort_slices(values, np.array([0, 10]), np.array([10, len(values)]))
+    mock_executor.assert_called_once()
+    assert np.array_equal(sorted_values, expected)
@@ -1,9 +1,13 @@
 # tests/test_plots.py
 import pytest
+from unittest.mock import patch
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
-from src.utils.plots import BoxPlot, CumulativeFrequencyPlot, SignificancePlot
+from plotly.subplots import make_subplots
+from src.utils.plots import _box_summary, BoxPlot, CumulativeFrequencyPlot, SignificancePlot, WEBGL_THRESHOLD, ECDF_MAX_POINTS
 from box import Box
+from src.utils.group_cache import FrameGroups, sorted_group_values
 
 @pytest.fixture
 def mock_df():
@@ -65,3 +69,148 @@ def test_significance_plot_returns_figure(mock_df, mock_style_settings, mock_res
     plotter = SignificancePlot()
     fig = plotter.plot(mock_df, 'group', 'value', style_settings=mock_style_settings, limits=mock_limits, results=mock_results)
     assert isinstance(fig, go.Figure)
+    assert fig.data[0].y.dtype == np.float64
+    assert list(fig.data[0].x) == [result["column"] for result in mock_results]
+
+def test_cumulative_frequency_plot_uses_webgl_for_large_groups(mock_style_settings, mock_limits):
+    n = WEBGL_THRESHOLD + 1
+    df = pd.DataFrame({'group': ['A'] * n + ['B'] * 2, 'value': list(range(n)) + [1, 2]})
+    fig = CumulativeFrequencyPlot().plot(df, 'group', 'value', style_settings=mock_style_settings, limits=mock_limits)
+    assert [trace.type for trace in fig.data] == ['scattergl', 'scatter']
+
+def test_cumulative_frequency_plot_downsamples_large_groups(mock_style_settings, mock_limits):
+    n = ECDF_MAX_POINTS * 3
+    df = pd.DataFrame({'group': ['A'] * n, 'value': range(n, 0, -1)})
+    fig = CumulativeFrequencyPlot().plot(df, 'group', 'value', style_settings=mock_style_settings, limits=mock_limits)
+    trace = fig.data[0]
+    assert len(trace.x) == ECDF_MAX_POINTS
+    assert (trace.x[0], trace.x[-1]) == (1, n)
+    assert (trace.y[0], trace.y[-1]) == (1 / n, 1.0)
+
+def test_cumulative_frequency_plot_values(mock_style_settings, mock_limits):
+    df = pd.DataFrame({'group': ['B', 'A', 'B', 'A', 'B'], 'value': [3, 2, 1, 1, 2]})
+    fig = CumulativeFrequencyPlot().plot(df, 'group', 'value', style_settings=mock_style_settings, limits=mock_limits)
+    traces = {trace.name: trace for trace in fig.data}
+    assert list(traces['A'].x) == [1, 2]
+    assert list(traces['A'].y) == [0.5, 1.0]
+    assert list(traces['B'].x) == [1, 2, 3]
+    assert list(traces['B'].y) == pytest.approx([1 / 3, 2 / 3, 1.0])
+    assert traces['B'].y.dtype == np.float32
+
+def test_cumulative_frequency_plot_keeps_x_precision(mock_style_settings, mock_limits):
+    df = pd.DataFrame({'group': ['A', 'A'], 'value': [1.000000123, 123456.789]})
+    fig = CumulativeFrequencyPlot().plot(df, 'group', 'value', style_settings=mock_style_settings, limits=mock_limits)
+    assert list(fig.data[0].x) == [1.000000123, 123456.789]
+
+def test_boxplot_one_trace_per_group(mock_df, mock_style_settings, mock_limits):
+    fig = BoxPlot().plot(mock_df, 'group', 'value', style_settings=mock_style_settings, limits=mock_limits)
+    assert [trace.name for trace in fig.data] == ['A', 'B']
+    assert not any(trace.showlegend for trace in fig.data)
+    assert (fig.data[1].q1, fig.data[1].median, fig.data[1].q3) == ((3.25,), (3.5,), (3.75,))
+
+def test_boxplot_skips_missing_values_and_empty_groups(mock_style_settings, mock_limits):
+    df = pd.DataFrame({'group': ['B', 'A', 'A', 'B', 'C', None], 'value': [4.0, 1.0, None, 2.0, None, 9.0]})
+    fig = BoxPlot().plot(df, 'group', 'value', style_settings=mock_style_settings, limits=mock_limits)
+    assert [trace.name for trace in fig.data] == ['A', 'B']
+    assert fig.data[1].median == (3.0,)
+
+def test_boxplot_all_points_from_style(mock_df, mock_style_settings, mock_limits):
+    style_settings = Box(mock_style_settings.to_dict())
+    style_settings.box_plot = {"points": "all"}
+    fig = BoxPlot().plot(mock_df, 'group', 'value', style_settings=style_settings, limits=mock_limits)
+    assert fig.data[0].boxpoints == "all"
+    assert [list(points) for points in fig.data[0].y] == [[1, 2]]
+    default_fig = BoxPlot().plot(mock_df, 'group', 'value', style_settings=mock_style_settings, limits=mock_limits)
+    assert default_fig.data[0].boxpoints == "outliers"
+    assert [list(points) for points in default_fig.data[0].y] == [[]]
+
+def test_plots_share_the_run_grouping(mock_style_settings, mock_limits):
+    df = pd.DataFrame({'group': ['A', 'B', 'A', 'B'], 'value': [0.11, 0.12, 0.13, 0.14]})
+    groups = FrameGroups(df, 'group')
+    with patch('src.utils.group_cache.sorted_group_values', wraps=sorted_group_values) as mock_sorted:
+        BoxPlot().plot(df, 'group', 'value', style_settings=mock_style_settings, limits=mock_limits, groups=groups)
+        CumulativeFrequencyPlot().plot(df, 'group', 'value', style_settings=mock_style_settings, limits=mock_limits, groups=groups)
+    mock_sorted.assert_called_once()
+
+def test_box_summary_keeps_only_outliers():
+    summary = _box_summary(np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 100.0]))
+    assert summary["median"] == [4.5]
+    assert (summary["lowerfence"], summary["upperfence"]) == ([1.0], [7.0])
+    assert [list(points) for points in summary["y"]] == [[100.0]]
+
+@pytest.mark.parametrize("is_horizontal", [True, False])
+def test_limit_lines_match_plotly_spanning_lines(mock_df, mock_style_settings, mock_limits, is_horizontal):
+    fig = make_subplots(rows=1, cols=2)
+    expected = make_subplots(rows=1, cols=2)
+    for f in (fig, expected):
+        f.add_trace(go.Scatter(x=[1], y=[1]), row=1, col=2)
+
+    CumulativeFrequencyPlot()._add_all_limit_lines(fig, mock_limits, is_horizontal, mock_style_settings, row=1, col=2)
+    add_line = expected.add_hline if is_horizontal else expected.add_vline
+    for value, key in [(1.0, "LSL"), (5.0, "USL"), (3.0, "T")]:
+        style = mock_style_settings.limits[key]
+        suffix = "horizontal" if is_horizontal else "vertical"
+        add_line(
+            value, row=1, col=2, line_dash="dash", line_color=style.line_color,
+            annotation_text=style.annotation_text, annotation_position=style[f"annotation_position_{suffix}"],
+            annotation_xshift=style.get(f"annotation_xshift_{suffix}"), annotation_yshift=style.get(f"annotation_yshift_{suffix}"),
+        )
+
+    assert fig.layout.shapes == expected.layout.shapes
+    assert fig.layout.annotations == expected.layout.annotations
+
+def test_significance_alpha_line_matches_add_hline(mock_df, mock_style_settings, mock_results):
+    fig = make_subplots(rows=1, cols=2)
+    SignificancePlot().plot(mock_df, 'group', 'value', style_settings=mock_style_settings, limits={}, fig=fig, row=1, col=2, results=mock_results)
+    expected = make_subplots(rows=1, cols=2)
+    expected.add_trace(go.Bar(x=[1], y=[1]), row=1, col=2)
+    expected.add_hline(y=0.05, line_dash="dash", line_color="red", annotation_text="Alpha=0.05", annotation_position="top right", row=1, col=2)
+    assert fig.layout.shapes == expected.layout.shapes
+    assert fig.layout.annotations == expected.layout.annotations
+
+def test_limit_line_without_label_adds_no_annotation(mock_style_settings, mock_limits):
+    style_settings = Box(mock_style_settings.to_dict())
+    style_settings.limits.T.annotation_text = ""
+    fig = go.Figure()
+    CumulativeFrequencyPlot()._add_all_limit_lines(fig, mock_limits, True, style_settings)
+    assert len(fig.layout.shapes) == 3
+    assert [annotation.text for annotation in fig.layout.annotations] == ["LSL", "USL"]
+
+def test_axis_style_applies_to_subplot_axes(mock_df, mock_style_settings, mock_limits):
+    fig = make_subplots(rows=1, cols=2)
+    CumulativeFrequencyPlot().plot(mock_df, 'group', 'value', style_settings=mock_style_settings, limits=mock_limits, fig=fig, row=1, col=2)
+    assert fig.layout.xaxis2.gridcolor == "lightgray"
+    assert fig.layout.yaxis2.tickfont.size == 12
+    assert fig.layout.xaxis.gridcolor is None
+
+def test_figures_serialize_to_json(mock_df, mock_style_settings, mock_limits):
+    import plotly.io as pio
+    fig = CumulativeFrequencyPlot().plot(mock_df, 'group', 'value', style_settings=mock_style_settings, limits=mock_limits)
+    assert pio.from_json(fig.to_json()).data[0].name == fig.data[0].name
+
+@pytest.mark.parametrize("results", [None, []])
+def test_significance_plot_without_results(mock_df, mock_style_settings, results):
+    plotter = SignificancePlot()
+    fig = plotter.plot(mock_df, 'group', 'value', style_settings=mock_style_settings, limits={}, results=results)
+    assert len(fig.data) == 0
+    # Each call gets its own figure, so changes to one cannot leak into later runs
+    fig.update_layout(title_text="changed")
+    assert plotter.plot(mock_df, 'group', 'value', style_settings=mock_style_settings, limits={}, results=results) is not fig
+    assert plotter.plot(mock_df, 'group', 'value', style_settings=mock_style_settings, limits={}, results=results).layout.title.text is None
+    own_fig = go.Figure()
+    assert plotter.plot(mock_df, 'group', 'value', style_settings=mock_style_settings, limits={}, fig=own_fig, results=results) is own_fig
+
+def test_significance_plot_keeps_tiny_p_values(mock_df, mock_style_settings):
+    results = [{'column': 'value', 'p_value': 1e-50}, {'column': 'other', 'p_value': 3e-40}]
+    fig = SignificancePlot().plot(mock_df, 'group', 'value', style_settings=mock_style_settings, limits={}, results=results)
+    assert list(fig.data[0].y) == [1e-50, 3e-40]
+
+def test_cumulative_frequency_plot_categorical_groups(mock_df, mock_style_settings, mock_limits):
+    categorical_df = mock_df.assign(group=pd.Categorical(mock_df['group'], categories=['C', 'B', 'A']))
+    fig = CumulativeFrequencyPlot().plot(categorical_df, 'group', 'value', style_settings=mock_style_settings, limits=mock_limits)
+    expected = CumulativeFrequencyPlot().plot(mock_df, 'group', 'value', style_settings=mock_style_settings, limits=mock_limits)
+    assert [trace.name for trace in fig.data] == ['B', 'A']
+    for trace in fig.data:
+        match = next(t for t in expected.data if t.name == trace.name)
+        np.testing.assert_array_equal(trace.x, match.x)
+        np.testing.assert_array_equal(trace.y, match.y)
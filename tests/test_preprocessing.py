@@ -1,6 +1,7 @@
 import pytest
 import pandas as pd
-from src.utils.preprocessing import filter_outliers
+from src.utils.group_cache import grouped_frame, sorted_group_values
+from src.utils.preprocessing import _mad_mask, filter_outliers
 
 @pytest.fixture
 def outlier_data():
@@ -20,3 +21,32 @@ def test_filter_outliers_removes_outlier(outlier_data):
 
     # Group A should be unaffected
     assert len(filtered_df[filtered_df['group'] == 'A']) == 10
+
+def test_filter_outliers_keeps_row_order_and_constant_groups():
+    df = pd.DataFrame({
+        'group': ['B', 'A', 'B', 'A', 'C', 'B', None],
+        'value': [1.0, 5.0, 1.0, 5.0, 2.0, 50.0, 1.0]
+    })
+    filtered_df = filter_outliers(df, 'value', 'group', sigma_cutoff=3.0)
+
+    # Zero-MAD groups are kept whole, rows without a group are dropped, the original order is kept
+    assert filtered_df['group'].tolist() == ['B', 'A', 'B', 'A', 'C', 'B']
+    assert filtered_df.index.tolist() == list(range(6))
+
+def test_filter_outliers_ignores_missing_values_in_medians():
+    df = pd.DataFrame({
+        'group': ['A'] * 6,
+        'value': [1.0, 2.0, 3.0, None, 2.5, 40.0]
+    })
+    filtered_df = filter_outliers(df, 'value', 'group', sigma_cutoff=3.0)
+
+    # Median 2.5 and MAD 0.5 come from the five present values; the missing value and 40.0 are dropped
+    assert filtered_df['value'].tolist() == [1.0, 2.0, 3.0, 2.5]
+
+def test_mad_mask_on_group_layout():
+    df = pd.DataFrame({
+        'group': ['A', 'A', 'A', 'A', 'B', 'B', None],
+        'value': [1.0, 2.0, 3.0, 100.0, 5.0, 5.0, 7.0]
+    })
+    mask = _mad_mask(df['value'].to_numpy(), sorted_group_values(df, 'group', 'value'), grouped_frame(df, 'group'), 3.0)
+    assert mask.tolist() == [True, True, True, False, True, True, False]
@@ -1,5 +1,6 @@
 import pytest
 import pandas as pd
+import numpy as np
 from src.utils.relevance_decorator import relevance_decorator
 
 def mock_analysis_significant(df, group_col, value_col):
@@ -47,3 +48,10 @@ def test_relevance_decorator_missing_limits():
     result = decorated_analysis(pd.DataFrame(), "", "")
     assert result["relevance"] is False
     assert "Missing lower or upper limit" in result["message"]
+
+def test_relevance_decorator_returns_plain_bool_for_numpy_means():
+    limits = {"lower_limit": 0, "upper_limit": 50}
+    def numpy_means(df, group_col, value_col):
+        return {"significant": True, "mean_values": [np.float64(10), np.float64(20)]}
+    result = relevance_decorator(limits, threshold=0.1)(numpy_means)(pd.DataFrame(), "", "")
+    assert type(result["relevance"]) is bool
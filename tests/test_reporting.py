@@ -1,18 +1,26 @@
+import asyncio
 import pytest
-from unittest.mock import MagicMock, patch, mock_open, call
+from unittest.mock import AsyncMock, MagicMock, patch, mock_open, call
 import plotly.graph_objects as go
+import plotly.io as pio
+from kaleido.errors import ChromeNotFoundError
+from src.utils import reporting
 from src.utils.reporting import (
+    _encode_png,
     generate_report,
     report_generator_factory,
     InteractiveHTMLReportGenerator,
     StaticHTMLReportGenerator,
     PDFReportGenerator,
+    ReportContext,
 )
 from pathlib import Path
+from io import BytesIO
+from PIL import Image
 
 from box import Box
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_config():
     return Box({
         "output": {
@@ -24,14 +32,14 @@ def mock_config():
         "report": {"name": "my_test_report"},
     })
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_plots():
     return {
-        "Plot 1": go.Figure(),
-        "Plot 2": go.Figure(),
+        "Plot 1": go.Figure(layout_title_text="Plot 1"),
+        "Plot 2": go.Figure(layout_title_text="Plot 2"),
     }
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_results():
     return [
         {
@@ -63,13 +71,18 @@ def test_interactive_html_report_generator(mock_file_open, mock_mkdir, mock_get_
     filename = Path("test_report_output/my_test_report.html")
     mock_file_open.assert_called_once_with(filename, "w")
     handle = mock_file_open()
-    handle.write.assert_any_call("<html><head><title>Analysis Report</title></head><body><a name=\"top\"></a>")
-    handle.write.assert_any_call("<h1>Analysis Report</h1>")
+    handle.write.assert_called_once()
+    html = handle.write.call_args.args[0]
+    assert html.startswith("<html><head><title>Analysis Report</title></head><body><a name=\"top\"></a>")
+    assert "<h1>Analysis Report</h1>" in html
+    assert html.endswith("</body></html>")
 
 @patch("src.utils.reporting.get_project_version", return_value="0.0.0")
 @patch("pathlib.Path.mkdir")
 @patch("builtins.open", new_callable=mock_open)
-def test_static_html_report_generator(mock_file_open, mock_mkdir, mock_get_version, mock_plots, mock_results, mock_config):
+@patch("src.utils.reporting._render_pngs", new_callable=AsyncMock, return_value=[b"png1", b"png2"])
+@patch("src.utils.reporting._encode_png", side_effect=lambda png, optimize: png)
+def test_static_html_report_generator(mock_encode_png, mock_render_pngs, mock_file_open, mock_mkdir, mock_get_version, mock_plots, mock_results, mock_config):
     generator = StaticHTMLReportGenerator(mock_plots, mock_results, mock_config)
     generator.generate()
 
@@ -77,30 +90,185 @@ def test_static_html_report_generator(mock_file_open, mock_mkdir, mock_get_versi
     filename = Path("test_report_output/my_test_report_static.html")
     mock_file_open.assert_called_once_with(filename, "w")
     handle = mock_file_open()
-    handle.write.assert_any_call("<html><head><title>Static Analysis Report</title></head><body><a name=\"top\"></a>")
-    handle.write.assert_any_call("<h1>Static Analysis Report</h1>")
+    handle.write.assert_called_once()
+    html = handle.write.call_args.args[0]
+    assert html.startswith("<html><head><title>Static Analysis Report</title></head><body><a name=\"top\"></a>")
+    assert "<h1>Static Analysis Report</h1>" in html
+    mock_render_pngs.assert_awaited_once_with(list(mock_plots.values()))
+    assert "<img src=\"data:image/png;base64,cG5nMQ==\"/>" in html
+    # The size optimization is opt-in through the output config
+    assert [c.args[1] for c in mock_encode_png.call_args_list] == [False, False]
 
 
 @patch("src.utils.reporting.get_project_version", return_value="0.0.0")
 @patch("pathlib.Path.mkdir")
-@patch("src.utils.reporting.FPDF")
-@patch("plotly.graph_objects.Figure.write_image")
-@patch("src.utils.reporting.tempfile.NamedTemporaryFile")
-@patch("src.utils.reporting.os.remove")
-def test_pdf_report_generator(mock_os_remove, mock_tempfile, mock_write_image, mock_fpdf, mock_mkdir, mock_get_version, mock_plots, mock_results, mock_config):
-    # Mock the temporary file context manager
-    mock_temp_file_instance = MagicMock()
-    mock_temp_file_instance.__enter__.return_value.name = "temp_image.png"
-    mock_tempfile.return_value = mock_temp_file_instance
+def test_overview_table_html(mock_mkdir, mock_get_version, mock_results, mock_config):
+    plots = {"Plots for Test Column 1": go.Figure()}
+    generator = InteractiveHTMLReportGenerator(plots, mock_results, mock_config)
+    html = generator._generate_overview_table_html()
+
+    assert html.startswith("<h2>Analysis Overview</h2><table border='1'>")
+    assert "<td><a href=\"#Plots_for_Test_Column_1\">Test Column 1</a></td><td>T-Test</td><td>0.0400</td>" in html
+    assert "<td>Test Column 2</td><td>ANOVA</td><td>0.1000</td>" in html
+    assert html.count("<tr>") == 3
+
+
+@patch("src.utils.reporting.get_project_version", return_value="0.0.0")
+@patch("pathlib.Path.mkdir")
+def test_overview_table_html_fills_missing_fields(mock_mkdir, mock_get_version, mock_config):
+    results = [{"column": "Test Column 1", "test": "T-Test", "p_value": 0.5}]
+    generator = InteractiveHTMLReportGenerator({}, results, mock_config)
+
+    assert "<td>Test Column 1</td><td>T-Test</td><td>0.5000</td><td>N/A</td><td>N/A</td><td>N/A</td>" in generator._generate_overview_table_html()
+
+
+@patch("pathlib.Path.mkdir")
+def test_figure_html_is_serialized_once_per_run(mock_mkdir):
+    fig = go.Figure(go.Scatter(x=[1, 2], y=[3, 4]))
+    context = ReportContext({"Plot": fig}, [], Path("out"))
+    with patch("src.utils.reporting.pio.to_html", return_value="<div></div>") as mock_to_html:
+        assert context.figure_html(fig) == "<div></div>"
+        assert context.figure_html(fig) == "<div></div>"
+        context.figure_html(fig, include_plotlyjs=False)
+
+    assert mock_to_html.call_args_list == [
+        call(fig, full_html=False, include_plotlyjs='cdn', validate=False),
+        call(fig, full_html=False, include_plotlyjs=False, validate=False),
+    ]
+
+
+@patch("pathlib.Path.mkdir")
+def test_figure_html_follows_changes_between_runs(mock_mkdir):
+    fig = go.Figure(layout_title_text="Before")
+    assert "Before" in ReportContext({"Plot": fig}, [], Path("out")).figure_html(fig)
+
+    fig.update_layout(title_text="After")
+    assert "After" in ReportContext({"Plot": fig}, [], Path("out")).figure_html(fig)
+
+
+@patch("pathlib.Path.mkdir")
+@patch("src.utils.reporting._render_pngs", new_callable=AsyncMock)
+def test_figure_pngs_renders_each_figure_once_per_run(mock_render_pngs, mock_mkdir):
+    first, second = go.Figure(), go.Figure()
+    context = ReportContext({"First": first, "Second": second}, [], Path("out"))
+    mock_render_pngs.side_effect = [[b"png1"], [b"png2"], [b"png3"]]
+
+    assert context.figure_pngs([first]) == [b"png1"]
+    assert context.figure_pngs([first, second, first]) == [b"png1", b"png2", b"png1"]
+    # A new run renders the figures again, picking up changes made in between
+    assert ReportContext({"First": first}, [], Path("out")).figure_pngs([first]) == [b"png3"]
+
+    assert mock_render_pngs.await_args_list == [call([first]), call([second]), call([first])]
+
+
+@patch("src.utils.reporting.get_project_version", return_value="0.0.0")
+@patch("pathlib.Path.mkdir")
+def test_generators_share_the_plot_order(mock_mkdir, mock_get_version, mock_results, mock_config):
+    plots = {
+        "Plots_Test Column 2": go.Figure(),
+        "Plots_Other": go.Figure(),
+        "Plots_Test Column 1": go.Figure(),
+    }
+    context = ReportContext(plots, mock_results, Path("test_report_output"))
+    interactive = InteractiveHTMLReportGenerator(plots, mock_results, mock_config, context)
+    static = StaticHTMLReportGenerator(plots, mock_results, mock_config, context)
+
+    assert list(interactive.plots) == ["Plots_Test Column 1", "Plots_Test Column 2", "Plots_Other"]
+    assert static.plots is interactive.plots
+    assert static._generate_overview_table_html() is interactive._generate_overview_table_html()
+
+
+@patch("src.utils.reporting.get_project_version", return_value="0.0.0")
+@patch("pathlib.Path.mkdir")
+def test_overview_table_is_rendered_once_per_run(mock_mkdir, mock_get_version, mock_plots, mock_config):
+    results = [{"column": "Test Column 1", "test": "T-Test", "p_value": 0.5}]
+    with patch("src.utils.reporting._overview_table_html", wraps=reporting._overview_table_html) as mock_overview:
+        context = ReportContext(mock_plots, results, Path("out"))
+        for generator_cls in (InteractiveHTMLReportGenerator, StaticHTMLReportGenerator):
+            assert "<td>0.5000</td>" in generator_cls(mock_plots, results, mock_config, context)._generate_overview_table_html()
+        mock_overview.assert_called_once()
 
+        results[0]["p_value"] = 0.25
+        assert "<td>0.2500</td>" in InteractiveHTMLReportGenerator(mock_plots, results, mock_config)._generate_overview_table_html()
+
+
+@patch("pathlib.Path.mkdir")
+@patch("src.utils.reporting._render_pngs", new_callable=AsyncMock, return_value=[b"png1", b"png2"])
+def test_figure_pngs_renders_identical_figures_once(mock_render_pngs, mock_mkdir):
+    first = go.Figure(go.Scatter(x=[1, 2], y=[3, 4]))
+    copy = go.Figure(go.Scatter(x=[1, 2], y=[3, 4]))
+    other = go.Figure(go.Bar(x=["a"], y=[1]))
+
+    context = ReportContext({"First": first, "Copy": copy, "Other": other}, [], Path("out"))
+    assert context.figure_pngs([first, copy, other]) == [b"png1", b"png1", b"png2"]
+    mock_render_pngs.assert_awaited_once_with([first, other])
+
+
+@patch("pathlib.Path.mkdir")
+@patch("src.utils.reporting._render_pngs", new_callable=AsyncMock, return_value=[b"png1"])
+def test_figure_pngs_renders_inside_a_running_event_loop(mock_render_pngs, mock_mkdir):
+    fig = go.Figure(go.Scatter(x=[1], y=[2]))
+    context = ReportContext({"Plot": fig}, [], Path("out"))
+
+    async def in_notebook():
+        return context.figure_pngs([fig])
+
+    assert asyncio.run(in_notebook()) == [b"png1"]
+
+
+def test_render_pngs_uses_plotly_image_defaults(monkeypatch):
+    monkeypatch.setattr(pio.defaults, "default_width", 900)
+    monkeypatch.setattr(pio.defaults, "default_scale", 2)
+    monkeypatch.setattr(pio.defaults, "topojson", "https://example.org/topojson")
+    monkeypatch.setattr(pio.defaults, "mathjax", None)
+    monkeypatch.setattr(pio.defaults, "plotlyjs", "/opt/plotly.min.js")
+    sized = go.Figure(layout={"width": 400, "height": 300})
+    plain = go.Figure(layout={"template": {"layout": {"height": 250}}})
+
+    with patch("src.utils.reporting.Kaleido") as mock_kaleido:
+        tabs = mock_kaleido.return_value.__aenter__.return_value
+        tabs.calc_fig = AsyncMock(side_effect=[b"png1", b"png2"])
+        assert reporting._render_pngs_sync([sized, plain]) == [b"png1", b"png2"]
+
+    kopts = mock_kaleido.call_args.kwargs
+    assert kopts["plotlyjs"] == "/opt/plotly.min.js"
+    assert kopts.get("headers") == (pio.defaults.headers or None)
+    assert "mathjax" not in kopts
+    assert tabs.calc_fig.await_args_list == [
+        call(sized, opts={"format": "png", "width": 400, "height": 300, "scale": 2}, topojson="https://example.org/topojson"),
+        call(plain, opts={"format": "png", "width": 900, "height": 250, "scale": 2}, topojson="https://example.org/topojson"),
+    ]
+
+
+@patch("src.utils.reporting._render_pngs", new_callable=AsyncMock, side_effect=ChromeNotFoundError("no chrome"))
+def test_render_pngs_explains_missing_chrome(mock_render_pngs):
+    with pytest.raises(RuntimeError, match="plotly_get_chrome"):
+        reporting._render_pngs_sync([go.Figure()])
+
+
+@pytest.mark.parametrize("optimize", [False, True])
+def test_encode_png_keeps_image(optimize):
+    buffer = BytesIO()
+    Image.new("RGB", (20, 10), "white").save(buffer, format="PNG")
+    encoded = Image.open(BytesIO(_encode_png(buffer.getvalue(), optimize)))
+    assert encoded.format == "PNG"
+    assert encoded.size == (20, 10)
+
+
+@patch("src.utils.reporting.get_project_version", return_value="0.0.0")
+@patch("pathlib.Path.mkdir")
+@patch("src.utils.reporting.FPDF")
+@patch("src.utils.reporting._render_pngs", new_callable=AsyncMock, return_value=[b"png1", b"png2"])
+def test_pdf_report_generator(mock_render_pngs, mock_fpdf, mock_mkdir, mock_get_version, mock_plots, mock_results, mock_config):
     generator = PDFReportGenerator(mock_plots, mock_results, mock_config)
     generator.generate()
 
     mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
-    assert mock_write_image.call_count == 2
+    mock_render_pngs.assert_awaited_once_with(list(mock_plots.values()))
 
     pdf_instance = mock_fpdf.return_value
     assert pdf_instance.add_page.call_count == 4  # Title page, overview table + 2 plots
+    assert [c.args[0].getvalue() for c in pdf_instance.image.call_args_list] == [b"png1", b"png2"]
     pdf_instance.output.assert_called_once_with(str(Path("test_report_output/my_test_report.pdf")))
 
 
@@ -118,13 +286,25 @@ def test_report_generator_factory(mock_plots, mock_results, mock_config):
         report_generator_factory("unknown_format", mock_plots, mock_results, mock_config)
 
 
+@patch("src.utils.reporting.get_project_version", return_value="0.0.0")
+@patch("pathlib.Path.mkdir")
+def test_generator_uses_given_context(mock_mkdir, mock_get_version, mock_plots, mock_results, mock_config):
+    context = ReportContext(mock_plots, mock_results, Path("existing"))
+    generator = report_generator_factory("pdf", mock_plots, mock_results, mock_config, context)
+
+    assert generator.context is context
+    assert generator.output_dir == Path("existing")
+    mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
+
+
+@patch("pathlib.Path.mkdir")
 @patch("src.utils.reporting.report_generator_factory")
-def test_generate_report(mock_factory, mock_plots, mock_results, mock_config):
+def test_generate_report(mock_factory, mock_mkdir, mock_plots, mock_results, mock_config):
     mock_interactive_gen = MagicMock()
     mock_static_gen = MagicMock()
     mock_pdf_gen = MagicMock()
 
-    def side_effect(format, plots, results, config):
+    def side_effect(format, plots, results, config, context):
         if format == "interactive_html":
             return mock_interactive_gen
         elif format == "static_html":
@@ -134,12 +314,17 @@ def test_generate_report(mock_factory, mock_plots, mock_results, mock_config):
 
     mock_factory.side_effect = side_effect
 
-    generate_report(mock_plots, mock_results, mock_config)
+    with patch("src.utils.reporting._plots_by_significance", wraps=reporting._plots_by_significance) as mock_sort:
+        generate_report(mock_plots, mock_results, mock_config)
 
+    mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
+    mock_sort.assert_called_once_with(mock_plots, mock_results)
+    context = mock_factory.call_args.args[4]
+    assert context.output_dir == Path("test_report_output")
     mock_factory.assert_has_calls([
-        call("interactive_html", mock_plots, mock_results, mock_config),
-        call("static_html", mock_plots, mock_results, mock_config),
-        call("pdf", mock_plots, mock_results, mock_config)
+        call("interactive_html", mock_plots, mock_results, mock_config, context),
+        call("static_html", mock_plots, mock_results, mock_config, context),
+        call("pdf", mock_plots, mock_results, mock_config, context)
     ])
 
     mock_interactive_gen.generate.assert_called_once()